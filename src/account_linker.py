@@ -8,36 +8,116 @@ import base64
 import uuid
 import time
 import logging
+import random
+import re
 import struct
-import hmac
 import hashlib
 from typing import Dict, Any, Optional
-from steam_protobuf import SteamProtobufAuth
+from urllib.parse import quote
+from steam_protobuf import SteamProtobufAuth, encode_varint
 from steam_protobuf_login import SteamProtobufLogin
 
+logger = logging.getLogger(__name__)
+
+# Steam's character set for codes
+_STEAM_CHARS = "23456789BCDFGHJKMNPQRTVWXY"
+_STEAM_CHARS_LEN = len(_STEAM_CHARS)
+
+# Byte translation tables applying the HMAC inner/outer pad XOR
+_HMAC_IPAD_TABLE = bytes(b ^ 0x36 for b in range(256))
+_HMAC_OPAD_TABLE = bytes(b ^ 0x5C for b in range(256))
+
+# Steam JWTs carry the steamid as a quoted decimal string in "sub"
+_JWT_SUB_RE = re.compile(rb'"sub"\s*:\s*"(\d+)"')
+
+
+def _prepare_hmac_sha1(secret: bytes) -> tuple:
+    """Return SHA-1 states pre-fed with the HMAC inner and outer key pads"""
+    if len(secret) > 64:
+        secret = hashlib.sha1(secret).digest()
+    key = secret.ljust(64, b"\0")
+    inner = hashlib.sha1(key.translate(_HMAC_IPAD_TABLE))
+    outer = hashlib.sha1(key.translate(_HMAC_OPAD_TABLE))
+    return inner, outer
+
+
+def _encode_b64(value) -> str:
+    return base64.b64encode(value).decode('utf-8')
+
+
+def _decode_text(value) -> str:
+    # str() decodes any bytes-like object, including memoryview slices
+    return str(value, 'utf-8', 'replace')
+
 
 class AccountLinker:
     """Links a new Steam account to generate 2FA secrets"""
 
-    def __init__(self):
-        self.session = None
+    # Response field tables: field number -> result key (and converter for
+    # fields that need one), so the parsers do one dict lookup per field
+    _ADD_VARINT_FIELDS = {5: "server_time", 10: "status", 12: "confirm_type"}
+    _ADD_FIXED64_FIELDS = {2: "serial_number"}
+    _ADD_BYTES_FIELDS = {
+        1: ("shared_secret", _encode_b64),
+        3: ("revocation_code", _decode_text),
+        4: ("uri", _decode_text),
+        6: ("account_name", _decode_text),
+        7: ("token_gid", _decode_text),
+        8: ("identity_secret", _encode_b64),
+        11: ("phone_number_hint", _decode_text),
+    }
+    _FINALIZE_VARINT_FIELDS = {
+        1: ("success", lambda value: value == 1),
+        2: ("want_more", lambda value: value == 1),
+        3: ("server_time", int),
+        4: ("status", int),
+    }
+    _STATUS_VARINT_FIELDS = {1: "state"}
+
+    # Seconds finalize_authenticator keeps retrying before giving up
+    FINALIZE_DEADLINE = 20
+
+    # Maximum ITwoFactorService requests in flight per linker
+    MAX_CONCURRENT_REQUESTS = 4
+
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        # An injected session is borrowed and left open on exit
+        self.session = session
+        self._owns_session = session is None
         self.protobuf = SteamProtobufAuth()
+        # Hyphenated UUID form, as steamguard-cli and SDA maFiles use
         self.device_id = f"android:{uuid.uuid4()}"
+        self._device_id_bytes = self.device_id.encode('utf-8')
         self.access_token = None
         self.steamid = None
+        self._steamid_field = b""
+        self._access_token_param = ""
+        self._add_request = b""
+        # Keyed HMAC-SHA1 pad states for the current shared_secret, copied per code
+        self._hmac_secret = None
+        self._hmac_inner = None
+        self._hmac_outer = None
+        self._request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self._owns_session:
+            self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._owns_session and self.session:
             await self.session.close()
 
     def set_tokens(self, access_token: str, steamid: int):
         """Set the access token and steamid from login"""
         self.access_token = access_token
         self.steamid = steamid
+        # steamid and device_id are fixed for the linker's lifetime, so the
+        # steamid field and the whole AddAuthenticator/QueryStatus bodies
+        # are encoded once here
+        self._steamid_field = b"\x09" + struct.pack('<Q', steamid or 0)
+        self._access_token_param = f"access_token={quote(access_token or '', safe='')}"
+        self._add_request = self._encode_add_authenticator_request()
 
     async def add_authenticator(self) -> Dict[str, Any]:
         """
@@ -86,7 +166,7 @@ class AccountLinker:
             }
 
         except Exception as e:
-            logging.error(f"AddAuthenticator error: {e}")
+            logger.error("AddAuthenticator error: %s", e)
             return {"error": "exception", "message": str(e)}
 
     async def finalize_authenticator(self, sms_code: str, shared_secret: str, server_time: int) -> Dict[str, Any]:
@@ -98,25 +178,34 @@ class AccountLinker:
             return {"error": "Not logged in"}
 
         try:
-            # Try up to 30 times (Steam may request multiple codes)
+            # Bind the per-attempt helpers once; the steamid and access token
+            # parts of every request are already encoded by set_tokens
+            generate_code = self._generate_auth_code
+            build_request = self._build_finalize_request
+            send_request = self._send_twofactor_request
+            parse_response = self._parse_finalize_response
+            monotonic = time.monotonic
+
+            # Try up to 30 times within the deadline (Steam may request multiple codes)
+            deadline = monotonic() + self.FINALIZE_DEADLINE
             for attempt in range(30):
                 # Generate authenticator code for the current server_time
-                auth_code = self._generate_auth_code(shared_secret, server_time)
+                auth_code = generate_code(shared_secret, server_time)
 
                 # Build request with absolute timestamp (not divided by 30)
-                request_data = self._build_finalize_request(auth_code, server_time, sms_code)
+                request_data = build_request(auth_code, server_time, sms_code)
 
-                logging.debug(f"Finalize attempt {attempt+1}, server_time={server_time}, code={auth_code}")
+                logger.debug("Finalize attempt %d, server_time=%s, code=%s", attempt + 1, server_time, auth_code)
 
-                response = await self._send_twofactor_request(
+                response = await send_request(
                     "FinalizeAddAuthenticator", 1, request_data
                 )
 
                 if not response:
                     return {"error": "No response from Steam"}
 
-                result = self._parse_finalize_response(response)
-                logging.debug(f"Finalize response: {result}")
+                result = parse_response(response)
+                logger.debug("Finalize response: %s", result)
 
                 if result.get("success"):
                     return {"success": True}
@@ -126,6 +215,9 @@ class AccountLinker:
                     return {"error": "bad_code", "message": "Invalid SMS/email code"}
                 elif status != 0 and status != 1:
                     return {"error": "steam_error", "message": f"Steam error: {status}"}
+                elif status == 1 and not result.get("want_more"):
+                    # Steam answered OK but neither succeeded nor asked for another code
+                    return {"error": "steam_error", "message": "Steam did not accept the authenticator"}
 
                 # Not yet successful, try with updated server_time
                 new_server_time = result.get("server_time", 0)
@@ -133,13 +225,16 @@ class AccountLinker:
                     server_time = new_server_time
                 else:
                     server_time += 30
-                await asyncio.sleep(0.5)
-                continue
+
+                delay = min(2.0, 0.1 * (1.5 ** attempt)) + random.uniform(0, 0.05)
+                if monotonic() + delay > deadline:
+                    break
+                await asyncio.sleep(delay)
 
             return {"error": "timeout", "message": "Too many attempts, please try again"}
 
         except Exception as e:
-            logging.error(f"FinalizeAuthenticator error: {e}")
+            logger.error("FinalizeAuthenticator error: %s", e)
             return {"error": "exception", "message": str(e)}
 
     async def query_status(self) -> Dict[str, Any]:
@@ -154,40 +249,44 @@ class AccountLinker:
 
             return {"active": False}
         except Exception as e:
-            logging.error(f"QueryStatus error: {e}")
+            logger.error("QueryStatus error: %s", e)
             return {"active": False}
 
     def _generate_auth_code(self, shared_secret: str, server_time: int) -> str:
         """Generate a Steam Guard code from shared_secret"""
-        # Steam's character set for codes
-        chars = "23456789BCDFGHJKMNPQRTVWXY"
-
-        # Decode the shared secret
-        secret = base64.b64decode(shared_secret)
+        # Decode the shared secret and key the HMAC pads once per secret
+        if shared_secret != self._hmac_secret:
+            secret = base64.b64decode(shared_secret)
+            self._hmac_inner, self._hmac_outer = _prepare_hmac_sha1(secret)
+            self._hmac_secret = shared_secret
 
         # Calculate time interval
-        time_bytes = (server_time // 30).to_bytes(8, byteorder='big')
+        time_bytes = struct.pack('>Q', server_time // 30)
 
-        # Generate HMAC-SHA1
-        mac = hmac.new(secret, time_bytes, hashlib.sha1)
-        digest = mac.digest()
+        # Generate HMAC-SHA1 from copies of the keyed pad states
+        inner = self._hmac_inner.copy()
+        inner.update(time_bytes)
+        outer = self._hmac_outer.copy()
+        outer.update(inner.digest())
+        digest = outer.digest()
 
-        # Get offset from last nibble
-        offset = digest[19] & 0x0F
-
-        # Extract 4 bytes and convert to code
-        code_int = int.from_bytes(digest[offset:offset+4], byteorder='big') & 0x7FFFFFFF
+        # Read 4 big-endian bytes at the offset given by the last nibble
+        code_int = struct.unpack_from('>I', digest, digest[19] & 0x0F)[0] & 0x7FFFFFFF
 
         # Generate 5 character code
-        code = ""
-        for _ in range(5):
-            code += chars[code_int % len(chars)]
-            code_int //= len(chars)
+        chars_out = [""] * 5
+        for i in range(5):
+            code_int, r = divmod(code_int, _STEAM_CHARS_LEN)
+            chars_out[i] = _STEAM_CHARS[r]
 
-        return code
+        return "".join(chars_out)
 
     def _build_add_authenticator_request(self) -> bytes:
-        """Build protobuf request for AddAuthenticator
+        """Build protobuf request for AddAuthenticator"""
+        return self._add_request
+
+    def _encode_add_authenticator_request(self) -> bytes:
+        """Encode protobuf request for AddAuthenticator
 
         Proto definition (CTwoFactor_AddAuthenticator_Request):
             field 1: steamid (fixed64)
@@ -195,50 +294,39 @@ class AccountLinker:
             field 5: device_identifier (string)
             field 8: version (uint32)
         """
-        data = b""
-        # Field 1: steamid (fixed64, wire type 1, tag = (1 << 3) | 1 = 0x09)
-        data += b"\x09" + struct.pack('<Q', self.steamid)
-        # Field 4: authenticator_type = 1 (uint32, wire type 0, tag = (4 << 3) | 0 = 0x20)
-        data += b"\x20\x01"
-        # Field 5: device_identifier (string, wire type 2, tag = (5 << 3) | 2 = 0x2a)
-        device_bytes = self.device_id.encode('utf-8')
-        data += b"\x2a" + self._encode_varint(len(device_bytes)) + device_bytes
-        # Field 8: version = 2 (uint32, wire type 0, tag = (8 << 3) | 0 = 0x40)
-        data += b"\x40\x02"
-        return data
+        device_bytes = self._device_id_bytes
+        return b"".join((
+            # Field 1: steamid (fixed64, wire type 1, tag = (1 << 3) | 1 = 0x09)
+            self._steamid_field,
+            # Field 4: authenticator_type = 1 (uint32, wire type 0, tag = (4 << 3) | 0 = 0x20)
+            b"\x20\x01",
+            # Field 5: device_identifier (string, wire type 2, tag = (5 << 3) | 2 = 0x2a)
+            b"\x2a", encode_varint(len(device_bytes)), device_bytes,
+            # Field 8: version = 2 (uint32, wire type 0, tag = (8 << 3) | 0 = 0x40)
+            b"\x40\x02",
+        ))
 
     def _build_finalize_request(self, auth_code: str, auth_time: int, sms_code: str) -> bytes:
         """Build protobuf request for FinalizeAddAuthenticator"""
-        data = b""
-        # Field 1: steamid (fixed64, wire type 1)
-        data += b"\x09" + struct.pack('<Q', self.steamid)
-        # Field 2: authenticator_code (string)
         code_bytes = auth_code.encode('utf-8')
-        data += b"\x12" + self._encode_varint(len(code_bytes)) + code_bytes
-        # Field 3: authenticator_time (uint64)
-        data += b"\x18" + self._encode_varint(auth_time)
-        # Field 4: activation_code (string) - the SMS code
         sms_bytes = sms_code.encode('utf-8')
-        data += b"\x22" + self._encode_varint(len(sms_bytes)) + sms_bytes
-        # Field 6: validate_sms_code = true (bool)
-        data += b"\x30\x01"
-        return data
+        return b"".join((
+            # Field 1: steamid (fixed64, wire type 1)
+            self._steamid_field,
+            # Field 2: authenticator_code (string)
+            b"\x12", encode_varint(len(code_bytes)), code_bytes,
+            # Field 3: authenticator_time (uint64)
+            b"\x18", encode_varint(auth_time),
+            # Field 4: activation_code (string) - the SMS code
+            b"\x22", encode_varint(len(sms_bytes)), sms_bytes,
+            # Field 6: validate_sms_code = true (bool)
+            b"\x30\x01",
+        ))
 
     def _build_status_request(self) -> bytes:
         """Build protobuf request for QueryStatus"""
-        data = b""
         # Field 1: steamid (fixed64, wire type 1)
-        data += b"\x09" + struct.pack('<Q', self.steamid)
-        return data
-
-    def _encode_varint(self, value: int) -> bytes:
-        """Encode an integer as a protobuf varint"""
-        result = b""
-        while value > 127:
-            result += bytes([(value & 0x7F) | 0x80])
-            value >>= 7
-        result += bytes([value & 0x7F])
-        return result
+        return self._steamid_field
 
     def _parse_add_authenticator_response(self, data: bytes) -> Dict[str, Any]:
         """Parse AddAuthenticator response"""
@@ -258,8 +346,15 @@ class AccountLinker:
         """
         result = {}
         pos = 0
-
-        while pos < len(data):
+        # Length-delimited values are sliced from a view (no copy) and
+        # only decoded for fields the result actually keeps
+        view = memoryview(data)
+        n = len(data)
+        varint_fields = self._ADD_VARINT_FIELDS
+        fixed64_fields = self._ADD_FIXED64_FIELDS
+        bytes_fields = self._ADD_BYTES_FIELDS
+
+        while pos < n:
             tag, pos = self._decode_varint(data, pos)
             if tag == 0:
                 break
@@ -268,40 +363,26 @@ class AccountLinker:
 
             if wire_type == 0:  # Varint
                 value, pos = self._decode_varint(data, pos)
-                if field_num == 5:
-                    result["server_time"] = value
-                elif field_num == 10:
-                    result["status"] = value
-                elif field_num == 12:
-                    result["confirm_type"] = value
+                key = varint_fields.get(field_num)
+                if key:
+                    result[key] = value
             elif wire_type == 1:  # Fixed64
-                value = struct.unpack('<Q', data[pos:pos+8])[0]
+                value = struct.unpack_from('<Q', data, pos)[0]
                 pos += 8
-                if field_num == 2:
-                    result["serial_number"] = value
+                key = fixed64_fields.get(field_num)
+                if key:
+                    result[key] = value
             elif wire_type == 2:  # Length-delimited (bytes or string)
                 length, pos = self._decode_varint(data, pos)
-                value = data[pos:pos+length]
+                handler = bytes_fields.get(field_num)
+                if handler:
+                    key, decode = handler
+                    result[key] = decode(view[pos:pos+length])
                 pos += length
-
-                if field_num == 1:
-                    result["shared_secret"] = base64.b64encode(value).decode('utf-8')
-                elif field_num == 3:
-                    result["revocation_code"] = value.decode('utf-8', errors='replace')
-                elif field_num == 4:
-                    result["uri"] = value.decode('utf-8', errors='replace')
-                elif field_num == 6:
-                    result["account_name"] = value.decode('utf-8', errors='replace')
-                elif field_num == 7:
-                    result["token_gid"] = value.decode('utf-8', errors='replace')
-                elif field_num == 8:
-                    result["identity_secret"] = base64.b64encode(value).decode('utf-8')
-                elif field_num == 11:
-                    result["phone_number_hint"] = value.decode('utf-8', errors='replace')
-            elif wire_type == 5:  # Fixed32
-                pos += 4
             else:
-                continue
+                pos = self._skip_field(data, pos, wire_type)
+                if pos < 0:
+                    break
 
         return result
 
@@ -310,16 +391,16 @@ class AccountLinker:
 
         Proto definition (CTwoFactor_FinalizeAddAuthenticator_Response):
             field 1: success (bool)
+            field 2: want_more (bool)
             field 3: server_time (uint64)
             field 4: status (int32)
         """
-        result = {"success": False, "status": 0, "server_time": 0}
+        result = {"success": False, "want_more": False, "status": 0, "server_time": 0}
         pos = 0
+        n = len(data)
+        varint_fields = self._FINALIZE_VARINT_FIELDS
 
-        while pos < len(data):
-            if pos >= len(data):
-                break
-
+        while pos < n:
             tag, pos = self._decode_varint(data, pos)
             if tag == 0:
                 break
@@ -328,21 +409,14 @@ class AccountLinker:
 
             if wire_type == 0:  # Varint
                 value, pos = self._decode_varint(data, pos)
-                if field_num == 1:
-                    result["success"] = value == 1
-                elif field_num == 3:
-                    result["server_time"] = value
-                elif field_num == 4:
-                    result["status"] = value
-            elif wire_type == 2:  # Length-delimited (skip)
-                length, pos = self._decode_varint(data, pos)
-                pos += length
-            elif wire_type == 1:  # Fixed64
-                pos += 8
-            elif wire_type == 5:  # Fixed32
-                pos += 4
+                handler = varint_fields.get(field_num)
+                if handler:
+                    key, decode = handler
+                    result[key] = decode(value)
             else:
-                continue
+                pos = self._skip_field(data, pos, wire_type)
+                if pos < 0:
+                    break
 
         return result
 
@@ -350,34 +424,66 @@ class AccountLinker:
         """Parse QueryStatus response"""
         result = {}
         pos = 0
+        n = len(data)
+        varint_fields = self._STATUS_VARINT_FIELDS
 
-        while pos < len(data):
-            if pos >= len(data):
+        while pos < n:
+            tag, pos = self._decode_varint(data, pos)
+            if tag == 0:
                 break
-
-            tag_byte = data[pos]
-            field_num = tag_byte >> 3
-            wire_type = tag_byte & 0x07
-            pos += 1
+            field_num = tag >> 3
+            wire_type = tag & 0x07
 
             if wire_type == 0:  # Varint
                 value, pos = self._decode_varint(data, pos)
-                if field_num == 1:
-                    result["state"] = value
+                key = varint_fields.get(field_num)
+                if key:
+                    result[key] = value
             else:
-                break
+                pos = self._skip_field(data, pos, wire_type)
+                if pos < 0:
+                    break
 
         return result
 
+    def _skip_field(self, data: bytes, pos: int, wire_type: int) -> int:
+        """Skip over a field the caller does not use
+
+        Returns the position after the field, or -1 for wire types that
+        cannot be skipped (deprecated groups and invalid values).
+        """
+        if wire_type == 0:  # Varint
+            return self._decode_varint(data, pos)[1]
+        if wire_type == 1:  # Fixed64
+            return pos + 8
+        if wire_type == 2:  # Length-delimited
+            length, pos = self._decode_varint(data, pos)
+            return pos + length
+        if wire_type == 5:  # Fixed32
+            return pos + 4
+        return -1
+
     def _decode_varint(self, data: bytes, pos: int) -> tuple:
         """Decode a protobuf varint"""
-        result = 0
-        shift = 0
-        while pos < len(data):
+        # Fast paths for one- and two-byte varints (tags, lengths, status codes)
+        n = len(data)
+        if pos >= n:
+            return 0, pos
+        byte = data[pos]
+        if byte < 0x80:
+            return byte, pos + 1
+        result = byte & 0x7F
+        if pos + 1 < n:
+            byte = data[pos + 1]
+            if byte < 0x80:
+                return result | (byte << 7), pos + 2
+        pos += 1
+        shift = 7
+        while pos < n:
             byte = data[pos]
             pos += 1
             result |= (byte & 0x7F) << shift
-            if not (byte & 0x80):
+            if byte < 0x80:
                 break
             shift += 7
         return result, pos
@@ -386,28 +492,29 @@ class AccountLinker:
         """Send a request to ITwoFactorService"""
         url = f"https://api.steampowered.com/ITwoFactorService/{method}/v{version}/"
 
-        # Encode data as base64
+        # Encode data as base64 and build the urlencoded form body directly;
+        # the access_token part is quoted once in set_tokens
         encoded_data = base64.b64encode(data).decode('ascii')
-
-        form_data = aiohttp.FormData()
-        form_data.add_field('input_protobuf_encoded', encoded_data)
-        form_data.add_field('access_token', self.access_token)
+        body = f"input_protobuf_encoded={quote(encoded_data, safe='')}&{self._access_token_param}"
 
         headers = {
+            'Content-Type': 'application/x-www-form-urlencoded',
             'User-Agent': 'steamguard-cli'
         }
 
         try:
-            logging.debug(f"Sending {method} to {url}, protobuf hex: {data.hex()}")
-            async with self.session.post(url, data=form_data, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                if response.status == 200:
-                    return await response.read()
-                else:
-                    body = await response.text()
-                    logging.error(f"Steam API error: {response.status}, body: {body[:500]}")
-                    return None
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending %s to %s, protobuf hex: %s", method, url, data.hex())
+            async with self._request_semaphore:
+                async with self.session.post(url, data=body, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    if response.status == 200:
+                        return await response.read()
+                    else:
+                        body = await response.text()
+                        logger.error("Steam API error: %s, body: %s", response.status, body[:500])
+                        return None
         except Exception as e:
-            logging.error(f"Request error: {e}")
+            logger.error("Request error: %s", e)
             return None
 
 
@@ -419,8 +526,25 @@ async def link_account(username: str, password: str, sms_callback) -> Dict[str,
 
     Returns account data dict on success, or error dict on failure
     """
+    # One session (and one bounded connection pool) for every stage so the
+    # login and twofactor requests share keep-alive connections to
+    # api.steampowered.com
+    connector = aiohttp.TCPConnector(
+        limit=16,
+        limit_per_host=AccountLinker.MAX_CONCURRENT_REQUESTS,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+    )
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return await _link_account_with_session(session, username, password, sms_callback)
+
+
+async def _link_account_with_session(session: aiohttp.ClientSession, username: str,
+                                     password: str, sms_callback) -> Dict[str, Any]:
+    """Run the linking flow over an already open session"""
     # Step 1: Login to get access token
-    async with SteamProtobufLogin() as login:
+    async with SteamProtobufLogin(session=session) as login:
         login_result = await login.complete_login_flow(username, password)
 
         if login_result.get("error"):
@@ -435,17 +559,19 @@ async def link_account(username: str, password: str, sms_callback) -> Dict[str,
         access_token = login_result.get("access_token")
         if not access_token:
             return {"error": "token_error", "message": "No access token received"}
-        # Extract steamid from JWT
-        import json
+        # Extract steamid from the JWT's "sub" claim
         token_parts = access_token.split('.')
+        match = None
         if len(token_parts) >= 2:
-            payload = json.loads(base64.b64decode(token_parts[1] + '=='))
-            steamid = int(payload.get("sub", 0))
-        else:
+            encoded = token_parts[1]
+            payload = base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4))
+            match = _JWT_SUB_RE.search(payload)
+        if not match:
             return {"error": "token_error", "message": "Could not parse access token"}
+        steamid = int(match.group(1))
 
     # Step 2: Add authenticator
-    async with AccountLinker() as linker:
+    async with AccountLinker(session=session) as linker:
         linker.set_tokens(access_token, steamid)
 
         add_result = await linker.add_authenticator()
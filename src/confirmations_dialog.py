@@ -1,91 +1,183 @@
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, GLib
+from gi.repository import Gtk, Gdk, Adw, GLib, Gio, GObject
 import asyncio
-import threading
+import functools
+import itertools
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 from steam_guard import SteamGuardAccount
 from steam_api import SteamAPI
-from login_dialog import LoginDialog
 from mafile_manager import MaFileManager
 
+# Themed icon paintables shared by every row, keyed by (name, size, scale)
+_icon_paintables: Dict[Tuple[str, int, int], Gtk.IconPaintable] = {}
 
-class ExpandableConfirmationRow(Gtk.ListBoxRow):
-    """Expandable row for trade confirmations with detailed item view"""
+
+def _icon_image(icon_name: str, size: int, scale: int = 1) -> Gtk.Image:
+    """Create a Gtk.Image backed by a cached themed paintable
+
+    The icon theme lookup happens once per icon; every image after that
+    shares the same paintable.
+    """
+    key = (icon_name, size, scale)
+    paintable = _icon_paintables.get(key)
+    if paintable is None:
+        theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())
+        paintable = theme.lookup_icon(icon_name, None, size, scale, Gtk.TextDirection.NONE, 0)
+        _icon_paintables[key] = paintable
+    image = Gtk.Image.new_from_paintable(paintable)
+    image.set_pixel_size(size)
+    return image
+
+
+# Static part of a confirmation row: header with expand and accept/deny
+# buttons. Accept/deny activate the dialog's "list" actions with the
+# confirmation id as target; titles and icons are filled in per row.
+_ROW_UI = """
+<interface>
+  <object class="AdwActionRow" id="header_row">
+    <child type="suffix">
+      <object class="GtkButton" id="expand_button">
+        <property name="icon-name">pan-end-symbolic</property>
+        <property name="tooltip-text">Show trade details</property>
+        <style>
+          <class name="flat"/>
+          <class name="circular"/>
+        </style>
+      </object>
+    </child>
+    <child type="suffix">
+      <object class="GtkBox">
+        <property name="spacing">6</property>
+        <property name="valign">center</property>
+        <child>
+          <object class="GtkButton" id="accept_button">
+            <property name="action-name">list.accept</property>
+            <property name="icon-name">emblem-ok-symbolic</property>
+            <property name="tooltip-text">Accept</property>
+            <style>
+              <class name="suggested-action"/>
+              <class name="circular"/>
+            </style>
+          </object>
+        </child>
+        <child>
+          <object class="GtkButton" id="deny_button">
+            <property name="action-name">list.deny</property>
+            <property name="icon-name">window-close-symbolic</property>
+            <property name="tooltip-text">Deny</property>
+            <style>
+              <class name="destructive-action"/>
+              <class name="circular"/>
+            </style>
+          </object>
+        </child>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
+
+class ConfirmationItem(GObject.Object):
+    """List model item wrapping one confirmation dict"""
+
+    __gtype_name__ = "ConfirmationItem"
+
+    def __init__(self, confirmation: Dict[str, Any]):
+        super().__init__()
+        self.confirmation = confirmation
+        # Kept on the item so it survives row recycling while scrolling
+        self.expanded = False
+
+    @functools.cached_property
+    def trade_summary(self) -> Optional[Tuple[str, Optional[str], bool]]:
+        """Parsed (give_text, receive_text, receives_nothing) for trade offers
+
+        The description has the format "You will give up X | You will receive Y".
+        give_text is empty and receive_text None when that side is missing.
+        Parsed once per item so re-expanding a row only rebuilds widgets.
+        """
+        if self.confirmation.get("type_id") != 2:
+            return None
+        description = self.confirmation.get("description", "")
+        if not description:
+            return None
+
+        give_part, sep, receive_part = description.partition(" | ")
+
+        give_text = ""
+        if give_part.startswith(("You will give up", "you will give up")):
+            give_text = give_part.removeprefix("You will give up your ")
+            if len(give_text) == len(give_part):
+                give_text = give_part.removeprefix("You will give up ")
+
+        receive_text = None
+        receives_nothing = False
+        if sep:
+            # Only the first separator matters; drop anything after a second one
+            receive_part = receive_part.partition(" | ")[0]
+            receive_text = receive_part.removeprefix("You will receive ")
+            receives_nothing = receive_text in ("Nothing", "nothing")
+
+        return give_text, receive_text, receives_nothing
+
+
+class ExpandableConfirmationRow(Gtk.Box):
+    """Expandable row for trade confirmations with detailed item view
+
+    Rows are recycled by the confirmations Gtk.ListView: the widgets are
+    built once and bind() points them at a different ConfirmationItem.
+    """
     
-    def __init__(self, confirmation: Dict[str, Any], account: SteamGuardAccount, **kwargs):
-        super().__init__(**kwargs)
+    def __init__(self, account: SteamGuardAccount, dialog: "ConfirmationsDialog", **kwargs):
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, **kwargs)
         
-        self.confirmation = confirmation
         self.account = account
-        self.expanded = False
-        self.trade_details = None
+        self.dialog = dialog
+        self.item = None
+        self.details_item = None  # Item the details box was last built for
         
         self.setup_ui()
+
+    @property
+    def confirmation(self) -> Dict[str, Any]:
+        return self.item.confirmation if self.item else {}
+
+    @property
+    def expanded(self) -> bool:
+        return self.item.expanded if self.item else False
     
     def setup_ui(self):
-        # Main container
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        self.set_child(main_box)
-        
-        # Header row (always visible)
-        self.header_row = Adw.ActionRow()
-        main_box.append(self.header_row)
-        
-        # Get confirmation details
-        conf_type = self.confirmation.get("type", "Trade")
-        title = self.confirmation.get("title", conf_type)
-        description = self.confirmation.get("description", "")
-        
-        self.header_row.set_title(title)
-        if description:
-            self.header_row.set_subtitle(description)
+        # Header row (always visible); the static parts come from the template
+        builder = Gtk.Builder.new_from_string(_ROW_UI, -1)
+        self.header_row = builder.get_object("header_row")
+        self.append(self.header_row)
         
         # Add icon
-        image = Gtk.Image.new_from_icon_name("package-x-generic-symbolic")
-        image.set_pixel_size(32)
+        image = _icon_image("package-x-generic-symbolic", 32, self.dialog.get_scale_factor())
         self.header_row.add_prefix(image)
         
-        # Expand arrow button
-        self.expand_button = Gtk.Button()
-        self.expand_button.set_icon_name("pan-end-symbolic")
-        self.expand_button.add_css_class("flat")
-        self.expand_button.add_css_class("circular")
-        self.expand_button.set_tooltip_text("Show trade details")
+        self.expand_button = builder.get_object("expand_button")
         self.expand_button.connect("clicked", self.on_expand_clicked)
-        self.header_row.add_suffix(self.expand_button)
-        
-        # Action buttons
-        button_box = Gtk.Box(spacing=6)
-        button_box.set_valign(Gtk.Align.CENTER)
-        
-        accept_button = Gtk.Button()
-        accept_button.set_icon_name("emblem-ok-symbolic")
-        accept_button.add_css_class("suggested-action")
-        accept_button.add_css_class("circular")
-        accept_button.set_tooltip_text("Accept")
-        accept_button.connect("clicked", self.on_accept_clicked)
-        button_box.append(accept_button)
-        
-        deny_button = Gtk.Button()
-        deny_button.set_icon_name("window-close-symbolic")
-        deny_button.add_css_class("destructive-action")
-        deny_button.add_css_class("circular")
-        deny_button.set_tooltip_text("Deny")
-        deny_button.connect("clicked", self.on_deny_clicked)
-        button_box.append(deny_button)
-        
-        self.header_row.add_suffix(button_box)
-        
-        # Expandable details section (initially hidden)
+        self.accept_button = builder.get_object("accept_button")
+        self.deny_button = builder.get_object("deny_button")
+        
+        # Expandable details section, built on first expand since most
+        # confirmations are never expanded
+        self.details_revealer = None
+        self.details_box = None
+
+    def build_details(self):
+        """Create the (initially hidden) details section"""
         self.details_revealer = Gtk.Revealer()
         self.details_revealer.set_reveal_child(False)
-        main_box.append(self.details_revealer)
+        self.append(self.details_revealer)
         
         # Details content
         self.details_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
@@ -94,56 +186,82 @@ class ExpandableConfirmationRow(Gtk.ListBoxRow):
         self.details_box.set_margin_start(48)  # Indent to align with title
         self.details_box.set_margin_end(12)
         self.details_revealer.set_child(self.details_box)
-        
-        # Loading spinner for details
-        self.loading_spinner = Gtk.Spinner()
-        self.loading_spinner.set_size_request(24, 24)
-        self.details_box.append(self.loading_spinner)
-        
-        loading_label = Gtk.Label(label="Loading trade details...")
-        loading_label.add_css_class("dim-label")
-        self.details_box.append(loading_label)
-    
-    def on_expand_clicked(self, button):
-        """Toggle expansion of trade details"""
-        if not self.expanded:
-            # Expand and load details
-            self.expanded = True
+
+    def bind(self, item: ConfirmationItem):
+        """Show the given confirmation in this (possibly recycled) row"""
+        self.item = item
+
+        # Get confirmation details
+        conf_type = item.confirmation.get("type", "Trade")
+        title = item.confirmation.get("title", conf_type)
+        description = item.confirmation.get("description", "")
+
+        self.header_row.set_title(title)
+        self.header_row.set_subtitle(description)
+
+        target = GLib.Variant("s", str(item.confirmation.get("id", "")))
+        self.accept_button.set_action_target_value(target)
+        self.deny_button.set_action_target_value(target)
+
+        self.set_expanded(item.expanded)
+
+    def unbind(self):
+        """Detach the row from its item before it is recycled"""
+        self.item = None
+
+    def set_expanded(self, expanded: bool):
+        """Show or hide the trade details for the bound item"""
+        if self.item:
+            self.item.expanded = expanded
+
+        if expanded:
             self.expand_button.set_icon_name("pan-down-symbolic")
-            self.details_revealer.set_reveal_child(True)
-            
-            if self.trade_details is None:
+            if self.details_revealer is None:
+                self.build_details()
+            if self.details_item is not self.item:
                 self.load_trade_details()
         else:
-            # Collapse
-            self.expanded = False
             self.expand_button.set_icon_name("pan-end-symbolic")
-            self.details_revealer.set_reveal_child(False)
+        if self.details_revealer is not None:
+            self.details_revealer.set_reveal_child(expanded)
+    
+    def on_expand_clicked(self, button):
+        """Toggle expansion of trade details"""
+        self.set_expanded(not self.expanded)
     
     def load_trade_details(self):
         """Load detailed trade information"""
-        # Clear loading content
-        while self.details_box.get_first_child():
-            self.details_box.remove(self.details_box.get_first_child())
-        
-        if self.confirmation.get("type_id") == 2:  # Trade offers
+        # Clear details left from a previously bound item
+        child = self.details_box.get_first_child()
+        while child is not None:
+            next_child = child.get_next_sibling()
+            self.details_box.remove(child)
+            child = next_child
+        self.details_item = self.item
+        
+        if self.confirmation.get("type_id") != 2:  # Not a trade offer
+            self.show_no_details()
+            return
+
+        summary = self.item.trade_summary
+        if summary and (summary[0] or summary[1] is not None):
             self.show_trade_details({})
         else:
-            self.show_no_details()
+            # Nothing to split into give/receive: one label instead of
+            # the preferences group hierarchy
+            self.show_plain_details()
     
     def show_trade_details(self, details):
         """Display the trade details"""
         # For now, show the description we already have from the confirmation
         # In a more advanced version, this would parse the Steam trade offer page
         
-        description = self.confirmation.get("description", "")
-        if description:
-            # Parse the existing description which has format "You will give up X | You will receive Y"
-            parts = description.split(" | ")
+        summary = self.item.trade_summary if self.item else None
+        if summary:
+            give_text, receive_text, receives_nothing = summary
             
             # Show what you're giving
-            if len(parts) > 0 and "give up" in parts[0].lower():
-                give_text = parts[0].replace("You will give up your ", "").replace("You will give up ", "")
+            if give_text:
                 give_group = Adw.PreferencesGroup()
                 give_group.set_title("📤 You will give:")
                 give_group.set_margin_top(8)
@@ -152,27 +270,24 @@ class ExpandableConfirmationRow(Gtk.ListBoxRow):
                 give_row.set_title(give_text)
                 
                 # Add item icon
-                item_icon = Gtk.Image.new_from_icon_name("package-x-generic-symbolic")
-                item_icon.set_pixel_size(20)
+                item_icon = _icon_image("package-x-generic-symbolic", 20, self.dialog.get_scale_factor())
                 give_row.add_prefix(item_icon)
                 
                 give_group.add(give_row)
                 self.details_box.append(give_group)
             
             # Show what you're receiving
-            if len(parts) > 1:
-                receive_text = parts[1].replace("You will receive ", "")
+            if receive_text is not None:
                 receive_group = Adw.PreferencesGroup()
                 receive_group.set_title("📥 You will receive:")
                 receive_group.set_margin_top(8)
                 
-                if receive_text.lower() == "nothing":
+                if receives_nothing:
                     nothing_row = Adw.ActionRow()
                     nothing_row.set_title("Nothing")
                     nothing_row.add_css_class("dim-label")
                     
-                    nothing_icon = Gtk.Image.new_from_icon_name("action-unavailable-symbolic")
-                    nothing_icon.set_pixel_size(20)
+                    nothing_icon = _icon_image("action-unavailable-symbolic", 20, self.dialog.get_scale_factor())
                     nothing_row.add_prefix(nothing_icon)
                     
                     receive_group.add(nothing_row)
@@ -181,8 +296,7 @@ class ExpandableConfirmationRow(Gtk.ListBoxRow):
                     receive_row.set_title(receive_text)
                     
                     # Add item icon
-                    item_icon = Gtk.Image.new_from_icon_name("package-x-generic-symbolic")
-                    item_icon.set_pixel_size(20)
+                    item_icon = _icon_image("package-x-generic-symbolic", 20, self.dialog.get_scale_factor())
                     receive_row.add_prefix(item_icon)
                     
                     receive_group.add(receive_row)
@@ -200,76 +314,44 @@ class ExpandableConfirmationRow(Gtk.ListBoxRow):
             id_row.set_title("Trade Offer ID")
             id_row.set_subtitle(trade_id)
             
-            info_icon = Gtk.Image.new_from_icon_name("dialog-information-symbolic")
-            info_icon.set_pixel_size(20)
+            info_icon = _icon_image("dialog-information-symbolic", 20, self.dialog.get_scale_factor())
             id_row.add_prefix(info_icon)
             
             info_group.add(id_row)
             self.details_box.append(info_group)
     
+    def show_plain_details(self):
+        """Show a trade whose description has no give/receive parts"""
+        lines = []
+        description = self.confirmation.get("description", "")
+        if description:
+            lines.append(description)
+        trade_id = self.confirmation.get("id", "")
+        if trade_id:
+            lines.append(f"Trade Offer ID: {trade_id}")
+        if not lines:
+            self.show_no_details()
+            return
+
+        label = Gtk.Label(label="\n".join(lines))
+        label.set_wrap(True)
+        label.set_xalign(0)
+        label.set_selectable(True)
+        self.details_box.append(label)
+
     def show_no_details(self):
         """Show message when details can't be loaded"""
         error_label = Gtk.Label(label="Unable to load trade details")
         error_label.add_css_class("dim-label")
         self.details_box.append(error_label)
-    
-    def _get_confirmations_dialog(self):
-        """Walk up the widget tree to find the ConfirmationsDialog parent"""
-        parent = self.get_parent()
-        while parent and not isinstance(parent, ConfirmationsDialog):
-            parent = parent.get_parent()
-        return parent
-
-    def on_accept_clicked(self, button):
-        """Handle accept button click with confirmation dialog"""
-        parent = self._get_confirmations_dialog()
-        if not parent:
-            return
-
-        title = self.confirmation.get("title", "this trade")
-        dialog = Adw.MessageDialog(
-            transient_for=parent,
-            heading="Accept Confirmation",
-            body=f"Are you sure you want to accept \"{title}\"?",
-        )
-        dialog.add_response("cancel", "Cancel")
-        dialog.add_response("accept", "Accept")
-        dialog.set_response_appearance("accept", Adw.ResponseAppearance.SUGGESTED)
-        dialog.connect("response", self._on_accept_response)
-        dialog.present()
-
-    def _on_accept_response(self, dialog, response):
-        if response == "accept":
-            parent = self._get_confirmations_dialog()
-            if parent:
-                parent.respond_to_confirmation(self.confirmation, True)
-
-    def on_deny_clicked(self, button):
-        """Handle deny button click with confirmation dialog"""
-        parent = self._get_confirmations_dialog()
-        if not parent:
-            return
-
-        title = self.confirmation.get("title", "this trade")
-        dialog = Adw.MessageDialog(
-            transient_for=parent,
-            heading="Deny Confirmation",
-            body=f"Are you sure you want to deny \"{title}\"?",
-        )
-        dialog.add_response("cancel", "Cancel")
-        dialog.add_response("deny", "Deny")
-        dialog.set_response_appearance("deny", Adw.ResponseAppearance.DESTRUCTIVE)
-        dialog.connect("response", self._on_deny_response)
-        dialog.present()
-
-    def _on_deny_response(self, dialog, response):
-        if response == "deny":
-            parent = self._get_confirmations_dialog()
-            if parent:
-                parent.respond_to_confirmation(self.confirmation, False)
 
 
 class ConfirmationsDialog(Adw.Window):
+    # Delay before running a refresh that was requested mid-fetch
+    REFRESH_COALESCE_MS = 150
+    # Items appended to the list per idle callback while populating it
+    DISPLAY_CHUNK_SIZE = 50
+
     def __init__(self, parent_window, account: SteamGuardAccount, **kwargs):
         super().__init__(**kwargs)
         
@@ -280,10 +362,52 @@ class ConfirmationsDialog(Adw.Window):
         
         self.account = account
         self.confirmations = []
-        self.selected_confirmations = set()
+        # Ids and keys of self.confirmations, in the same order
+        self.conf_ids: List[str] = []
+        self.conf_keys: List[str] = []
+        self.refresh_in_flight = False
+        self.refresh_pending = False
+        self.display_generation = 0  # Bumped to cancel an unfinished display
+
+        # Every Steam request made while the dialog is open runs on the
+        # application's background loop through one SteamAPI session (kept
+        # alive between requests)
+        self.api = SteamAPI()
+        self.app = Gio.Application.get_default()
+        self.loop = self.app.get_aio_loop()
+        self.connect("close-request", self.on_close_request)
+
+        # Accept/deny buttons of every row share these two actions; the
+        # target is the confirmation id
+        actions = Gio.SimpleActionGroup()
+        accept_action = Gio.SimpleAction.new("accept", GLib.VariantType.new("s"))
+        accept_action.connect("activate", self.on_accept_action)
+        actions.add_action(accept_action)
+        deny_action = Gio.SimpleAction.new("deny", GLib.VariantType.new("s"))
+        deny_action.connect("activate", self.on_deny_action)
+        actions.add_action(deny_action)
+        self.insert_action_group("list", actions)
         
         self.setup_ui()
         self.refresh_confirmations()
+
+    def run_async(self, coro, on_complete, error_message: str, default):
+        """Run coro on the background loop and pass its result to on_complete on the GTK thread
+
+        If the coroutine raises, the error is logged and on_complete gets default.
+        """
+        self.app.run_background(coro, on_complete, error_message, default)
+
+    async def get_api(self) -> SteamAPI:
+        """Return the dialog's SteamAPI, opening its session on first use"""
+        if self.api.session is None:
+            await self.api.__aenter__()
+        return self.api
+
+    def on_close_request(self, window):
+        # Only the dialog's session closes; the loop belongs to the app
+        asyncio.run_coroutine_threadsafe(self.api.__aexit__(None, None, None), self.loop)
+        return False
     
     def setup_ui(self):
         # Main box
@@ -298,7 +422,7 @@ class ConfirmationsDialog(Adw.Window):
         refresh_button = Gtk.Button()
         refresh_button.set_icon_name("view-refresh-symbolic")
         refresh_button.set_tooltip_text("Refresh confirmations")
-        refresh_button.connect("clicked", lambda _: self.refresh_confirmations())
+        refresh_button.connect("clicked", self.refresh_confirmations)
         header.pack_start(refresh_button)
         
         # Action buttons in header
@@ -318,19 +442,13 @@ class ConfirmationsDialog(Adw.Window):
         self.toast_overlay = Adw.ToastOverlay()
         main_box.append(self.toast_overlay)
         
-        # Scrolled window
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_vexpand(True)
-        scrolled.set_hexpand(True)
-        self.toast_overlay.set_child(scrolled)
-        
         # Content box
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         content_box.set_margin_top(12)
         content_box.set_margin_bottom(12)
         content_box.set_margin_start(12)
         content_box.set_margin_end(12)
-        scrolled.set_child(content_box)
+        self.toast_overlay.set_child(content_box)
         
         # Loading spinner
         self.loading_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
@@ -347,12 +465,27 @@ class ConfirmationsDialog(Adw.Window):
         
         content_box.append(self.loading_box)
         
-        # Confirmations list
-        self.confirmations_list = Gtk.ListBox()
-        self.confirmations_list.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.confirmations_list.add_css_class("boxed-list")
-        content_box.append(self.confirmations_list)
-        self.confirmations_list.set_visible(False)
+        # Confirmations list: a Gtk.ListView over a Gio.ListStore only
+        # creates rows for the visible items and recycles them on scroll
+        self.store = Gio.ListStore(item_type=ConfirmationItem)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self.on_factory_setup)
+        factory.connect("bind", self.on_factory_bind)
+        factory.connect("unbind", self.on_factory_unbind)
+
+        self.confirmations_list = Gtk.ListView(
+            model=Gtk.NoSelection(model=self.store),
+            factory=factory,
+        )
+        self.confirmations_list.add_css_class("card")
+
+        self.list_scrolled = Gtk.ScrolledWindow()
+        self.list_scrolled.set_vexpand(True)
+        self.list_scrolled.set_hexpand(True)
+        self.list_scrolled.set_child(self.confirmations_list)
+        content_box.append(self.list_scrolled)
+        self.list_scrolled.set_visible(False)
         
         # Empty state
         self.empty_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
@@ -404,9 +537,15 @@ class ConfirmationsDialog(Adw.Window):
         content_box.append(self.expired_box)
         self.expired_box.set_visible(False)
     
-    def refresh_confirmations(self):
+    def refresh_confirmations(self, _button=None):
+        # Coalesce refreshes requested while a fetch is running into one
+        # follow-up fetch once it completes
+        if self.refresh_in_flight:
+            self.refresh_pending = True
+            return
+
         self.loading_box.set_visible(True)
-        self.confirmations_list.set_visible(False)
+        self.list_scrolled.set_visible(False)
         self.empty_box.set_visible(False)
         self.expired_box.set_visible(False)
 
@@ -420,28 +559,18 @@ class ConfirmationsDialog(Adw.Window):
             return
         
         # Clear existing confirmations
-        while self.confirmations_list.get_first_child():
-            self.confirmations_list.remove(self.confirmations_list.get_first_child())
+        self.clear_store()
+        
+        async def fetch():
+            api = await self.get_api()
+            return await api.get_confirmations(self.account)
         
-        # Run async task
-        def run_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            async def fetch():
-                async with SteamAPI() as api:
-                    return await api.get_confirmations(self.account)
-            
-            try:
-                return loop.run_until_complete(fetch())
-            except Exception as e:
-                logger.error(f"Error fetching confirmations: {e}")
-                return None
-            finally:
-                loop.close()
-        
-        # Run in thread to avoid blocking UI
         def on_complete(confirmations):
+            self.refresh_in_flight = False
+            if self.refresh_pending:
+                self.refresh_pending = False
+                GLib.timeout_add(self.REFRESH_COALESCE_MS, self._run_pending_refresh)
+
             self.loading_box.set_visible(False)
             
             if confirmations is None:
@@ -449,40 +578,138 @@ class ConfirmationsDialog(Adw.Window):
                 self.empty_box.set_visible(True)
                 return
             
-            self.confirmations = confirmations
+            self.set_confirmations(confirmations)
             
             if not confirmations:
-                self.empty_box.set_visible(True)
-                self.accept_all_button.set_sensitive(False)
-                self.deny_all_button.set_sensitive(False)
+                self.show_empty_state()
             else:
-                self.confirmations_list.set_visible(True)
+                self.list_scrolled.set_visible(True)
                 self.accept_all_button.set_sensitive(True)
                 self.deny_all_button.set_sensitive(True)
                 self.display_confirmations(confirmations)
             
             return False
         
-        # Start async operation
-        def thread_func():
-            result = run_async()
-            GLib.idle_add(on_complete, result)
-        
-        thread = threading.Thread(target=thread_func)
-        thread.daemon = True
-        thread.start()
+        # Run on the background loop to avoid blocking UI
+        self.refresh_in_flight = True
+        self.run_async(fetch(), on_complete, "Error fetching confirmations", None)
+
+    def _run_pending_refresh(self):
+        self.refresh_confirmations()
+        return False
     
+    def show_empty_state(self):
+        self.list_scrolled.set_visible(False)
+        self.empty_box.set_visible(True)
+        self.accept_all_button.set_sensitive(False)
+        self.deny_all_button.set_sensitive(False)
+
+    def set_confirmations(self, confirmations: List[Dict[str, Any]]):
+        self.confirmations = confirmations
+        self.conf_ids = [conf["id"] for conf in confirmations]
+        self.conf_keys = [conf["key"] for conf in confirmations]
+
+    def remove_confirmation(self, conf_id: str):
+        """Drop a handled confirmation without fetching the list again"""
+        try:
+            index = self.conf_ids.index(conf_id)
+        except ValueError:
+            return
+
+        confirmations = self.confirmations[:index] + self.confirmations[index + 1:]
+        self.set_confirmations(confirmations)
+
+        if not confirmations:
+            self.clear_store()
+            self.show_empty_state()
+        elif index < self.store.get_n_items():
+            self.store.remove(index)
+        else:
+            # Not appended yet; restart the fill from the updated list
+            self.display_confirmations(confirmations)
+
+    def clear_store(self):
+        self.display_generation += 1
+        self.store.remove_all()
+
     def display_confirmations(self, confirmations):
-        for conf in confirmations:
-            # Create expandable row for detailed view
-            expandable_row = ExpandableConfirmationRow(conf, self.account)
-            self.confirmations_list.append(expandable_row)
-    
-    def on_accept_single(self, button, confirmation):
-        self.respond_to_confirmation(confirmation, True)
+        """Fill the list in chunks so the first rows show up right away"""
+        self.clear_store()
+        generation = self.display_generation
+        pending = iter(confirmations)
+
+        def append_chunk():
+            if generation != self.display_generation:
+                return False  # The list was cleared or refilled meanwhile
+            items = [ConfirmationItem(conf) for conf in itertools.islice(pending, self.DISPLAY_CHUNK_SIZE)]
+            if not items:
+                return False
+            self.store.splice(self.store.get_n_items(), 0, items)
+            return len(items) == self.DISPLAY_CHUNK_SIZE
+
+        if append_chunk():
+            GLib.idle_add(append_chunk)
+
+    def on_factory_setup(self, factory, list_item):
+        # Create expandable row for detailed view, reused across items
+        list_item.set_activatable(False)
+        list_item.set_child(ExpandableConfirmationRow(self.account, self))
+
+    def on_factory_bind(self, factory, list_item):
+        list_item.get_child().bind(list_item.get_item())
+
+    def on_factory_unbind(self, factory, list_item):
+        list_item.get_child().unbind()
     
-    def on_deny_single(self, button, confirmation):
-        self.respond_to_confirmation(confirmation, False)
+    def find_confirmation(self, conf_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self.confirmations[self.conf_ids.index(conf_id)]
+        except ValueError:
+            return None
+
+    def on_accept_action(self, action, parameter):
+        """Ask before accepting the confirmation whose row was clicked"""
+        confirmation = self.find_confirmation(parameter.get_string())
+        if confirmation is None:
+            return
+
+        title = confirmation.get("title", "this trade")
+        dialog = Adw.MessageDialog(
+            transient_for=self,
+            heading="Accept Confirmation",
+            body=f"Are you sure you want to accept \"{title}\"?",
+        )
+        dialog.add_response("cancel", "Cancel")
+        dialog.add_response("accept", "Accept")
+        dialog.set_response_appearance("accept", Adw.ResponseAppearance.SUGGESTED)
+        dialog.connect("response", self.on_accept_action_response, confirmation)
+        dialog.present()
+
+    def on_deny_action(self, action, parameter):
+        """Ask before denying the confirmation whose row was clicked"""
+        confirmation = self.find_confirmation(parameter.get_string())
+        if confirmation is None:
+            return
+
+        title = confirmation.get("title", "this trade")
+        dialog = Adw.MessageDialog(
+            transient_for=self,
+            heading="Deny Confirmation",
+            body=f"Are you sure you want to deny \"{title}\"?",
+        )
+        dialog.add_response("cancel", "Cancel")
+        dialog.add_response("deny", "Deny")
+        dialog.set_response_appearance("deny", Adw.ResponseAppearance.DESTRUCTIVE)
+        dialog.connect("response", self.on_deny_action_response, confirmation)
+        dialog.present()
+
+    def on_accept_action_response(self, dialog, response, confirmation):
+        if response == "accept":
+            self.respond_to_confirmation(confirmation, True)
+
+    def on_deny_action_response(self, dialog, response, confirmation):
+        if response == "deny":
+            self.respond_to_confirmation(confirmation, False)
     
     def on_accept_all(self, button):
         if not self.confirmations:
@@ -523,92 +750,62 @@ class ConfirmationsDialog(Adw.Window):
             self.respond_to_all_confirmations(False)
     
     def respond_to_confirmation(self, confirmation, accept: bool):
-        def run_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            async def respond():
-                async with SteamAPI() as api:
-                    return await api.respond_to_confirmation(
-                        self.account,
-                        confirmation["id"],
-                        confirmation["key"],
-                        accept
-                    )
-            
-            try:
-                return loop.run_until_complete(respond())
-            except Exception as e:
-                logger.error(f"Error responding to confirmation: {e}")
-                return False
-            finally:
-                loop.close()
+        async def respond():
+            api = await self.get_api()
+            return await api.respond_to_confirmation(
+                self.account,
+                confirmation["id"],
+                confirmation["key"],
+                accept
+            )
         
         def on_complete(success):
             if success:
                 action = "accepted" if accept else "denied"
                 self.show_toast(f"Confirmation {action}")
-                self.refresh_confirmations()
+                self.remove_confirmation(confirmation["id"])
             else:
                 self.show_toast("Could not process confirmation. Session may have expired.")
+                # Our copy of the list may be stale; fetch it again
+                self.refresh_confirmations()
             return False
         
-        # Start async operation
-        def thread_func():
-            result = run_async()
-            GLib.idle_add(on_complete, result)
-        
-        thread = threading.Thread(target=thread_func)
-        thread.daemon = True
-        thread.start()
+        self.run_async(respond(), on_complete, "Error responding to confirmation", False)
     
     def respond_to_all_confirmations(self, accept: bool):
         if not self.confirmations:
             return
         
-        def run_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            async def respond_all():
-                async with SteamAPI() as api:
-                    conf_ids = [c["id"] for c in self.confirmations]
-                    conf_keys = [c["key"] for c in self.confirmations]
-                    return await api.respond_to_multiple_confirmations(
-                        self.account,
-                        conf_ids,
-                        conf_keys,
-                        accept
-                    )
-            
-            try:
-                return loop.run_until_complete(respond_all())
-            except Exception as e:
-                logger.error(f"Error responding to all confirmations: {e}")
-                return False
-            finally:
-                loop.close()
+        conf_ids = self.conf_ids
+        conf_keys = self.conf_keys
+
+        async def respond_all():
+            api = await self.get_api()
+            return await api.respond_to_multiple_confirmations(
+                self.account,
+                conf_ids,
+                conf_keys,
+                accept
+            )
         
         def on_complete(success):
             if success:
                 action = "accepted" if accept else "denied"
                 self.show_toast(f"All confirmations {action}")
-                self.refresh_confirmations()
+                # Everything shown was just handled; clear locally instead of
+                # fetching the (now empty) list from Steam again
+                self.set_confirmations([])
+                self.clear_store()
+                self.show_empty_state()
             else:
                 self.show_toast("Could not process confirmations. Session may have expired.")
             return False
 
-        # Start async operation
-        def thread_func():
-            result = run_async()
-            GLib.idle_add(on_complete, result)
-        
-        thread = threading.Thread(target=thread_func)
-        thread.daemon = True
-        thread.start()
+        self.run_async(respond_all(), on_complete, "Error responding to all confirmations", False)
     
     def on_login_clicked(self, button):
         """Open login dialog for re-authentication"""
+        from login_dialog import LoginDialog
         dialog = LoginDialog(self, account=self.account)
 
         if hasattr(dialog, 'username_entry') and self.account.account_name:
@@ -633,6 +830,4 @@ class ConfirmationsDialog(Adw.Window):
         dialog.connect("close-request", on_dialog_close)
 
     def show_toast(self, message: str):
-        toast = Adw.Toast(title=message)
-        toast.set_timeout(2)
-        self.toast_overlay.add_toast(toast)
\ No newline at end of file
+        self.toast_overlay.add_toast(Adw.Toast(title=message, timeout=2))
\ No newline at end of file
@@ -1,18 +1,37 @@
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, GLib, Pango
+from gi.repository import Gtk, Adw, GLib, Gio, Pango
 import asyncio
-import threading
 import logging
+import re
 from typing import Optional, Dict, Any
 
 from steam_protobuf_login import SteamProtobufLogin
 from steam_guard import SteamGuardAccount
 
+# Friendly toasts for login errors, picked by the first pattern (checked in
+# order, case-insensitively) found in the error text: (pattern, message, timeout)
+_LOGIN_ERROR_TOASTS = (
+    (re.compile("invalid|password", re.I), "Incorrect username or password", 3),
+    (re.compile("rate|limit", re.I), "Rate limited. Wait a moment.", 5),
+    (re.compile("network|connection", re.I), "Connection error. Please check your internet.", 3),
+)
+
+# Same for Steam Guard code errors: (pattern, message)
+_TWOFA_ERROR_TOASTS = (
+    (re.compile("invalid|incorrect", re.I), "Invalid code. Please try again."),
+    (re.compile("expired", re.I), "Code expired. Please enter the new code."),
+)
+
 
 class LoginDialog(Adw.Window):
     """Steam login dialog similar to Windows Steam Desktop Authenticator"""
+
+    # Flat styling for the dialog, installed once per process
+    _flat_css_provider: Optional[Gtk.CssProvider] = None
+    # Typing bursts are coalesced into one button sensitivity check
+    FIELD_CHECK_DELAY_MS = 50
     
     def __init__(self, parent_window, account=None, **kwargs):
         super().__init__(**kwargs)
@@ -21,11 +40,28 @@ class LoginDialog(Adw.Window):
         self.set_default_size(380, 480)  # Slightly smaller and more compact
         self.set_transient_for(parent_window)
         self.set_modal(True)
+        self.add_css_class("login-dialog")
+        self.install_flat_css()
 
         self.login_result = None
         self.pending_auth = None
         self.account = account
 
+        # Pending GLib sources for the debounced button sensitivity checks
+        self.login_check_source = 0
+        self.twofa_check_source = 0
+
+        # Steam requests run on the application's background loop; results
+        # come back through GLib.idle_add
+        self.app = Gio.Application.get_default()
+        self.loop = self.app.get_aio_loop()
+
+        # One SteamProtobufLogin serves both the password and the 2FA step.
+        # Only touched from the background loop.
+        self.steam_login: Optional[SteamProtobufLogin] = None
+        asyncio.run_coroutine_threadsafe(self.get_steam_login(), self.loop)
+        self.connect("close-request", self.on_close_request)
+
         self.setup_ui()
 
         # Prefill username and focus password
@@ -33,6 +69,63 @@ class LoginDialog(Adw.Window):
             self.username_entry.set_text(self.account.account_name)
             self.password_entry.grab_focus()
     
+    def install_flat_css(self):
+        """Drop rounded corners, shadows and transitions inside the dialog
+
+        They are costly to draw with the software renderer. Skipped when
+        animations are enabled, so the default look is kept for those users.
+        """
+        if LoginDialog._flat_css_provider is not None:
+            return
+        settings = Gtk.Settings.get_default()
+        if settings is None or settings.get_property("gtk-enable-animations"):
+            return
+
+        provider = Gtk.CssProvider()
+        provider.load_from_data(
+            b"window.login-dialog, window.login-dialog * "
+            b"{ border-radius: 0; box-shadow: none; transition: none; }"
+        )
+        Gtk.StyleContext.add_provider_for_display(
+            self.get_display(),
+            provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_USER
+        )
+        LoginDialog._flat_css_provider = provider
+
+    def run_async(self, coro, on_complete, error_label: str):
+        """Run coro on the background loop and pass its result to on_complete on the GTK thread
+
+        If the coroutine raises, on_complete gets an {"error": ...} result.
+        """
+        async def guarded():
+            try:
+                return await coro
+            except Exception as e:
+                logging.error(f"{error_label}: {e}")
+                return {"error": str(e)}
+
+        # Default priority so the result is not queued behind redraws
+        # and other idle work on the GTK thread
+        self.app.run_background(guarded(), on_complete, error_label, None,
+                                priority=GLib.PRIORITY_DEFAULT)
+
+    async def get_steam_login(self) -> SteamProtobufLogin:
+        """Return the dialog's SteamProtobufLogin on the shared session"""
+        if self.steam_login is None:
+            self.steam_login = SteamProtobufLogin(session=await self.app.get_http_session())
+            await self.steam_login.__aenter__()
+        return self.steam_login
+
+    async def close_steam_login(self):
+        if self.steam_login is not None:
+            steam_login, self.steam_login = self.steam_login, None
+            await steam_login.__aexit__(None, None, None)
+
+    def on_close_request(self, window):
+        asyncio.run_coroutine_threadsafe(self.close_steam_login(), self.loop)
+        return False
+
     def setup_ui(self):
         # Main box
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
@@ -46,19 +139,18 @@ class LoginDialog(Adw.Window):
         self.toast_overlay = Adw.ToastOverlay()
         main_box.append(self.toast_overlay)
         
-        # Scrolled window
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_vexpand(True)
-        scrolled.set_hexpand(True)
-        self.toast_overlay.set_child(scrolled)
-        
-        # Content box (more compact)
+        # Content box (more compact). It always fits the dialog, so it goes
+        # into the overlay without a scrolled window; if larger fonts make it
+        # taller, the window grows to its minimum size instead of clipping
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
+        content_box.set_vexpand(True)
+        content_box.set_hexpand(True)
         content_box.set_margin_top(16)
         content_box.set_margin_bottom(16)
         content_box.set_margin_start(16)
         content_box.set_margin_end(16)
-        scrolled.set_child(content_box)
+        self.toast_overlay.set_child(content_box)
+        self.content_box = content_box
         
         # Title and description (more compact)
         title_label = Gtk.Label(label="Steam Login")
@@ -103,11 +195,20 @@ class LoginDialog(Adw.Window):
         self.login_button.connect("clicked", self.on_login_clicked)
         content_box.append(self.login_button)
         
-        # 2FA section (initially hidden)
+        # The 2FA and progress sections are built the first time they are shown
+        self.twofa_group = None
+        self.progress_box = None
+        
+        # Initially show only login form
+        self.show_login_form()
+    
+    def build_twofa_section(self):
+        """Create the 2FA code entry group and its submit button"""
+        # 2FA section
         self.twofa_group = Adw.PreferencesGroup()
         self.twofa_group.set_title("Two-Factor Authentication")
         self.twofa_group.set_description("Enter the code from your Steam Guard mobile app")
-        content_box.append(self.twofa_group)
+        self.content_box.append(self.twofa_group)
         
         # 2FA code entry
         self.twofa_entry = Adw.EntryRow()
@@ -122,9 +223,10 @@ class LoginDialog(Adw.Window):
         self.submit_2fa_button.add_css_class("suggested-action")
         self.submit_2fa_button.set_sensitive(False)
         self.submit_2fa_button.connect("clicked", self.on_submit_2fa)
-        content_box.append(self.submit_2fa_button)
-        
-        # Progress section
+        self.content_box.append(self.submit_2fa_button)
+
+    def build_progress_section(self):
+        """Create the progress spinner and label"""
         self.progress_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         self.progress_box.set_valign(Gtk.Align.CENTER)
         
@@ -136,48 +238,71 @@ class LoginDialog(Adw.Window):
         self.progress_label.add_css_class("dim-label")
         self.progress_box.append(self.progress_label)
         
-        content_box.append(self.progress_box)
-        
-        # Initially show only login form
-        self.show_login_form()
-    
+        self.content_box.append(self.progress_box)
+
     def show_login_form(self):
         """Show the initial login form"""
         self.login_group.set_visible(True)
         self.login_button.set_visible(True)
-        self.twofa_group.set_visible(False)
-        self.submit_2fa_button.set_visible(False)
-        self.progress_box.set_visible(False)
+        if self.twofa_group is not None:
+            self.twofa_group.set_visible(False)
+            self.submit_2fa_button.set_visible(False)
+        if self.progress_box is not None:
+            self.progress_box.set_visible(False)
     
     def show_2fa_form(self):
         """Show the 2FA code entry form"""
+        if self.twofa_group is None:
+            self.build_twofa_section()
         self.login_group.set_visible(False)
         self.login_button.set_visible(False)
         self.twofa_group.set_visible(True)
         self.submit_2fa_button.set_visible(True)
-        self.progress_box.set_visible(False)
+        if self.progress_box is not None:
+            self.progress_box.set_visible(False)
         self.twofa_entry.grab_focus()
     
     def show_progress(self, message: str):
         """Show progress spinner with message"""
+        if self.progress_box is None:
+            self.build_progress_section()
         self.login_group.set_visible(False)
         self.login_button.set_visible(False)
-        self.twofa_group.set_visible(False)
-        self.submit_2fa_button.set_visible(False)
+        if self.twofa_group is not None:
+            self.twofa_group.set_visible(False)
+            self.submit_2fa_button.set_visible(False)
         self.progress_box.set_visible(True)
         self.progress_spinner.start()
         self.progress_label.set_text(message)
     
+    # Button sensitivity stays with these debounced "changed" handlers rather
+    # than a Gtk.ClosureExpression binding: an expression's closure is still
+    # Python and would run on every keystroke, undoing the debounce.
     def on_field_changed(self, entry):
+        if not self.login_check_source:
+            self.login_check_source = GLib.timeout_add(self.FIELD_CHECK_DELAY_MS, self.update_login_sensitivity)
+
+    def update_login_sensitivity(self):
         """Enable login button when both fields are filled"""
-        username = self.username_entry.get_text().strip()
-        password = self.password_entry.get_text().strip()
-        self.login_button.set_sensitive(bool(username and password))
+        self.login_check_source = 0
+        username = self.username_entry.get_text()
+        password = self.password_entry.get_text()
+        self.login_button.set_sensitive(
+            bool(username) and not username.isspace() and
+            bool(password) and not password.isspace()
+        )
+        return False
     
     def on_twofa_changed(self, entry):
+        if not self.twofa_check_source:
+            self.twofa_check_source = GLib.timeout_add(self.FIELD_CHECK_DELAY_MS, self.update_twofa_sensitivity)
+
+    def update_twofa_sensitivity(self):
         """Enable submit button when 2FA code is entered"""
-        code = self.twofa_entry.get_text().strip()
-        self.submit_2fa_button.set_sensitive(len(code) >= 5)
+        self.twofa_check_source = 0
+        code = self.twofa_entry.get_text()
+        self.submit_2fa_button.set_sensitive(len(code) >= 5 and len(code.strip()) >= 5)
+        return False
     
     def on_login_clicked(self, button):
         """Handle login button click"""
@@ -189,52 +314,50 @@ class LoginDialog(Adw.Window):
             return
         
         self.show_progress("Signing in to Steam...")
-        
-        # Start login in background thread
-        def login_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            async def do_login():
-                async with SteamProtobufLogin() as steam_login:
-                    # Check if this account has Steam Guard enabled
-                    current_account = self.account
-                    if current_account is None:
-                        try:
-                            parent_app = self.get_transient_for().get_application()
-                            if parent_app:
-                                current_account = parent_app.current_account
-                        except Exception:
-                            pass
-
-                    # If this is the same account we have loaded, use automatic 2FA
-                    if (current_account and
-                        current_account.account_name == username and
-                        current_account.shared_secret):
-                        
-                        # Create auto 2FA callback
-                        async def auto_2fa_callback(guard_type=3):
-                            code = current_account.generate_steam_guard_code()
-                            logging.info("Auto-generated Steam Guard code for login")
-                            return code
-                        
-                        return await steam_login.complete_login_flow(username, password, auto_2fa_callback)
-                    else:
-                        # Manual 2FA flow for different accounts
-                        return await steam_login.complete_login_flow(username, password)
-            
+        self.run_async(
+            self._do_login(username, password, self.get_guard_account(username)),
+            self.handle_login_result,
+            "Login error"
+        )
+
+    def get_guard_account(self, username: str) -> Optional[SteamGuardAccount]:
+        """Return the loaded account that can answer Steam Guard for username
+
+        Resolved on the GTK thread, before the login coroutine starts.
+        """
+        # Check if this account has Steam Guard enabled
+        current_account = self.account
+        if current_account is None:
             try:
-                result = loop.run_until_complete(do_login())
-                GLib.idle_add(self.handle_login_result, result)
-            except Exception as e:
-                logging.error(f"Login error: {e}")
-                GLib.idle_add(self.handle_login_result, {"error": str(e)})
-            finally:
-                loop.close()
-        
-        thread = threading.Thread(target=login_thread)
-        thread.daemon = True
-        thread.start()
+                parent_app = self.get_transient_for().get_application()
+                if parent_app:
+                    current_account = parent_app.current_account
+            except Exception:
+                pass
+
+        # If this is the same account we have loaded, use automatic 2FA
+        if (current_account and
+            current_account.account_name == username and
+            current_account.shared_secret):
+            return current_account
+        return None
+
+    async def _do_login(self, username: str, password: str,
+                        guard_account: Optional[SteamGuardAccount]) -> Dict[str, Any]:
+        steam_login = await self.get_steam_login()
+
+        if guard_account is None:
+            # Manual 2FA flow for different accounts
+            return await steam_login.complete_login_flow(username, password)
+
+        # Create auto 2FA callback. The code is generated when Steam asks
+        # for it, so it belongs to the time window the request is made in.
+        async def auto_2fa_callback(guard_type=3):
+            code = guard_account.generate_steam_guard_code()
+            logging.info("Auto-generated Steam Guard code for login")
+            return code
+
+        return await steam_login.complete_login_flow(username, password, auto_2fa_callback)
     
     def handle_login_result(self, result):
         """Handle login result on main thread"""
@@ -243,23 +366,21 @@ class LoginDialog(Adw.Window):
             # Make error messages more user-friendly
             if "RATE_LIMITED" in error_msg:
                 self.show_toast("Rate limited. Wait a few minutes.", 5)
-            elif "invalid" in error_msg.lower() or "password" in error_msg.lower():
-                self.show_toast("Incorrect username or password")
-            elif "rate" in error_msg.lower() or "limit" in error_msg.lower():
-                self.show_toast("Rate limited. Wait a moment.", 5)
-            elif "network" in error_msg.lower() or "connection" in error_msg.lower():
-                self.show_toast("Connection error. Please check your internet.")
             else:
-                self.show_toast("Could not sign in. Please try again.")
+                for pattern, message, timeout in _LOGIN_ERROR_TOASTS:
+                    if pattern.search(error_msg):
+                        self.show_toast(message, timeout)
+                        break
+                else:
+                    self.show_toast("Could not sign in. Please try again.")
             self.show_login_form()
         elif result.get("needs_2fa"):
             self.pending_auth = result
             self.show_2fa_form()
         elif result.get("success"):
             self.login_result = result
-            self.show_progress("Login successful!")
-            # Close after showing success message
-            GLib.timeout_add(2000, lambda: self.close())
+            # The parent window reports the new session with its own toast
+            self.close()
         else:
             self.show_toast("Something went wrong. Please try again.")
             self.show_login_form()
@@ -277,51 +398,33 @@ class LoginDialog(Adw.Window):
             return
         
         self.show_progress("Verifying Steam Guard code...")
-        
-        # Submit 2FA code in background thread
-        def submit_2fa_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            async def do_submit():
-                async with SteamProtobufLogin() as steam_login:
-                    return await steam_login.complete_2fa_login(
-                        self.pending_auth["client_id"],
-                        self.pending_auth["request_id"],
-                        self.pending_auth["steamid"],
-                        code
-                    )
-            
-            try:
-                result = loop.run_until_complete(do_submit())
-                GLib.idle_add(self.handle_2fa_result, result)
-            except Exception as e:
-                logging.error(f"2FA error: {e}")
-                GLib.idle_add(self.handle_2fa_result, {"error": str(e)})
-            finally:
-                loop.close()
-        
-        thread = threading.Thread(target=submit_2fa_thread)
-        thread.daemon = True
-        thread.start()
+        self.run_async(self._do_submit_2fa(self.pending_auth, code), self.handle_2fa_result, "2FA error")
+
+    async def _do_submit_2fa(self, pending_auth: Dict[str, Any], code: str) -> Dict[str, Any]:
+        steam_login = await self.get_steam_login()
+        return await steam_login.complete_2fa_login(
+            pending_auth["client_id"],
+            pending_auth["request_id"],
+            pending_auth["steamid"],
+            code
+        )
     
     def handle_2fa_result(self, result):
         """Handle 2FA result on main thread"""
         if result.get("error"):
             error_msg = result['error']
-            if "invalid" in error_msg.lower() or "incorrect" in error_msg.lower():
-                self.show_toast("Invalid code. Please try again.")
-            elif "expired" in error_msg.lower():
-                self.show_toast("Code expired. Please enter the new code.")
+            for pattern, message in _TWOFA_ERROR_TOASTS:
+                if pattern.search(error_msg):
+                    self.show_toast(message)
+                    break
             else:
                 self.show_toast("Could not verify code. Please try again.")
             self.show_2fa_form()
             self.twofa_entry.set_text("")
         elif result.get("success"):
             self.login_result = result
-            self.show_progress("Authentication complete!")
-            # Close after showing success message
-            GLib.timeout_add(2000, lambda: self.close())
+            # The parent window reports the new session with its own toast
+            self.close()
         else:
             self.show_toast("Something went wrong. Please try again.")
             self.show_2fa_form()
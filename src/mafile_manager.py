@@ -1,15 +1,104 @@
 import json
+import mmap
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 from steam_guard import SteamGuardAccount
 from sda_compat import is_sda_folder, import_sda_accounts, verify_sda_passkey
 
+logger = logging.getLogger(__name__)
+
+# orjson parses and serializes JSON noticeably faster when it is installed.
+# loads and dumps_compact are shared with the rest of the app (backups);
+# maFiles themselves are written indented by _dumps.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+    dumps_compact = orjson.dumps
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    loads = json.loads
+
+    def dumps_compact(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode('utf-8')
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# Files at least this large are parsed straight from a memory map (orjson
+# only); for typical few-KB maFiles a plain read is cheaper than mapping
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+def _read_json(file_path: Path):
+    """Parse a JSON file, mapping it into memory instead of copying when worthwhile"""
+    with open(file_path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                mm = None  # Filesystem without mmap support; read normally
+            if mm is not None:
+                with mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+        return loads(f.read())
+
+
+def _write_atomic(file_path: Path, data: bytes, mode: int = 0o600):
+    """Write data through a temporary file that then replaces file_path
+
+    Readers see either the old or the new content, never a partial write.
+    The data is flushed to disk before the rename, so a crash cannot leave
+    an empty file behind. mode applies when the temporary file is created
+    (subject to umask).
+    """
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+# Characters that are not safe in filenames, mapped to "_"
+_UNSAFE_FILENAME_CHARS = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# validate_mafile_format only looks at this much of a file to tell JSON
+# from SDA ciphertext (base64)
+_SNIFF_SIZE = 1024
+_BASE64_ALPHABET = (b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+                    b"0123456789+/=\r\n")
+
+# ijson lets validation stop reading once the fields it checks have been seen
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 
 class MaFileManager:
     """Manages .maFile files like Steam Desktop Authenticator"""
+
+    # Upper bound on threads reading maFiles in parallel during a scan
+    MAX_SCAN_WORKERS = 8
     
     def __init__(self, mafiles_dir: Optional[Path] = None):
         if mafiles_dir is None:
@@ -32,38 +121,61 @@ class MaFileManager:
             self.mafiles_dir.mkdir(parents=True, exist_ok=True)
 
         logging.info(f"Using maFiles directory: {self.mafiles_dir}")
+
+        # Accounts from earlier scans, keyed by path, with the file's
+        # (mtime_ns, size) at the time it was parsed; None for files that failed
+        self._cache: Dict[Path, Tuple[int, int, Optional[SteamGuardAccount]]] = {}
     
     def scan_mafiles(self) -> List[SteamGuardAccount]:
         """Scan the maFiles directory and load all accounts"""
         accounts = []
         
         if not self.mafiles_dir.exists():
-            logging.warning(f"maFiles directory does not exist: {self.mafiles_dir}")
+            logger.warning("maFiles directory does not exist: %s", self.mafiles_dir)
             return accounts
         
-        for file_path in self.mafiles_dir.glob("*.maFile"):
+        # Only files that changed since the last scan are parsed again
+        stats = {}
+        for entry in self._scan_mafile_entries(self.mafiles_dir):
+            file_path = Path(entry.path)
             try:
-                account = self.load_mafile(file_path)
-                if account:
-                    accounts.append(account)
-                    logging.info(f"Loaded account: {account.account_name}")
-            except Exception as e:
-                logging.error(f"Failed to load {file_path}: {e}")
+                st = entry.stat()
+            except OSError as e:
+                logger.error("Failed to load %s: %s", file_path, e)
+                continue
+            stats[file_path] = (st.st_mtime_ns, st.st_size)
+        stale = [path for path, key in stats.items()
+                 if path not in self._cache or self._cache[path][:2] != key]
+
+        cache = {path: self._cache[path] for path in stats if path in self._cache}
+        if stale:
+            # Read and parse the files in parallel
+            with ThreadPoolExecutor(max_workers=min(self.MAX_SCAN_WORKERS, len(stale))) as executor:
+                for file_path, account in zip(stale, executor.map(self.load_mafile, stale)):
+                    # Files that fail to load are remembered as None, so they
+                    # are only read (and reported) again once they change
+                    cache[file_path] = (*stats[file_path], account)
+                    if account:
+                        logger.debug("Loaded account: %s", account.account_name)
+        self._cache = cache
+
+        # Keep directory order
+        accounts = [cache[path][2] for path in stats
+                    if path in cache and cache[path][2] is not None]
         
-        logging.info(f"Loaded {len(accounts)} accounts from maFiles")
+        logger.info("Loaded %d accounts from maFiles", len(accounts))
         return accounts
     
     def load_mafile(self, file_path: Path) -> Optional[SteamGuardAccount]:
         """Load a single .maFile"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json(file_path)
             
             # Validate required fields
             required_fields = ['account_name', 'shared_secret']
             for field in required_fields:
                 if field not in data:
-                    logging.error(f"Missing required field '{field}' in {file_path}")
+                    logger.error("Missing required field '%s' in %s", field, file_path)
                     return None
             
             # Create account from maFile data
@@ -73,33 +185,36 @@ class MaFileManager:
             return account
             
         except json.JSONDecodeError as e:
-            logging.error(f"Invalid JSON in {file_path}: {e}")
+            logger.error("Invalid JSON in %s: %s", file_path, e)
             return None
         except Exception as e:
-            logging.error(f"Error loading {file_path}: {e}")
+            logger.error("Error loading %s: %s", file_path, e)
             return None
     
+    def mafile_filename(self, account: SteamGuardAccount) -> str:
+        """File name save_mafile uses for account, in Steam ID format (Windows compatible)"""
+        # Use Steam ID format (like Windows Steam Desktop Authenticator)
+        if account.steamid:
+            # Validate steamid is purely numeric to prevent path traversal
+            if re.match(r'^\d+$', str(account.steamid)):
+                return f"{account.steamid}.maFile"
+            safe_name = self._sanitize_filename(str(account.steamid))
+            return f"{safe_name}.maFile"
+        # Fallback to account name if no Steam ID
+        safe_name = self._sanitize_filename(account.account_name or "unknown")
+        return f"{safe_name}.maFile"
+
     def save_mafile(self, account: SteamGuardAccount, filename: Optional[str] = None) -> Path:
         """Save account to .maFile using Steam ID format (Windows compatible)"""
         if filename is None:
-            # Use Steam ID format (like Windows Steam Desktop Authenticator)
-            if account.steamid:
-                # Validate steamid is purely numeric to prevent path traversal
-                if re.match(r'^\d+$', str(account.steamid)):
-                    filename = f"{account.steamid}.maFile"
-                else:
-                    safe_name = self._sanitize_filename(str(account.steamid))
-                    filename = f"{safe_name}.maFile"
-            else:
-                # Fallback to account name if no Steam ID
-                safe_name = self._sanitize_filename(account.account_name or "unknown")
-                filename = f"{safe_name}.maFile"
+            filename = self.mafile_filename(account)
         
         file_path = self.mafiles_dir / filename
+        self._cache.pop(file_path, None)
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(account.to_dict(), f, indent=2)
+            # Saves nearly always follow a change, so skip serialize()'s cache
+            _write_atomic(file_path, _dumps(account.to_dict()))
             os.chmod(file_path, 0o600)
 
             account.mafile_path = file_path
@@ -110,6 +225,39 @@ class MaFileManager:
             logging.error(f"Failed to save {file_path}: {e}")
             raise
     
+    def save_mafiles_bulk(self, accounts: List[SteamGuardAccount]) -> List[Path]:
+        """Save several accounts, then make the renames durable with one directory fsync
+
+        Each file's content is already synced by _write_atomic; syncing the
+        directory once covers the new names of the whole batch.
+        """
+        paths = [self.save_mafile(account) for account in accounts]
+
+        if paths:
+            dir_fd = os.open(self.mafiles_dir, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+        return paths
+
+    def save_raw(self, account_data: Dict[str, Any], filename: str) -> Path:
+        """Save an already-parsed maFile dict as-is, without a to_dict() round trip"""
+        file_path = self.mafiles_dir / filename
+        self._cache.pop(file_path, None)
+
+        try:
+            _write_atomic(file_path, _dumps(account_data))
+            os.chmod(file_path, 0o600)
+
+            logging.info(f"Saved account to {file_path}")
+            return file_path
+
+        except Exception as e:
+            logging.error(f"Failed to save {file_path}: {e}")
+            raise
+
     async def save_account(self, account: SteamGuardAccount) -> bool:
         """Async version of save_mafile for use in SteamAPI"""
         try:
@@ -122,6 +270,7 @@ class MaFileManager:
     def delete_mafile(self, account: SteamGuardAccount) -> bool:
         """Delete the .maFile for an account"""
         if hasattr(account, 'mafile_path') and account.mafile_path:
+            self._cache.pop(account.mafile_path, None)
             try:
                 account.mafile_path.unlink()
                 logging.info(f"Deleted {account.mafile_path}")
@@ -148,8 +297,7 @@ class MaFileManager:
     def export_mafile(self, account: SteamGuardAccount, dest_path: Path) -> bool:
         """Export account to a .maFile at specified location"""
         try:
-            with open(dest_path, 'w', encoding='utf-8') as f:
-                json.dump(account.to_dict(), f, indent=2)
+            _write_atomic(Path(dest_path), account.serialize(_dumps), 0o666)
             
             logging.info(f"Exported account to {dest_path}")
             return True
@@ -158,6 +306,28 @@ class MaFileManager:
             logging.error(f"Failed to export to {dest_path}: {e}")
             return False
     
+    def export_mafiles(self, accounts: List[SteamGuardAccount], dest_dir: Path) -> int:
+        """Export accounts as plaintext .maFile files into dest_dir
+
+        Each account is serialized once and written in a single call; the
+        independent file writes are spread over a thread pool. Raises on the
+        first failed write. Returns the number of files written.
+        """
+        dest_dir = Path(dest_dir)
+
+        def write_one(account: SteamGuardAccount):
+            filename = f"{account.steamid or account.account_name}.maFile"
+            _write_atomic(dest_dir / filename, account.serialize(_dumps), 0o666)
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_SCAN_WORKERS, len(accounts) or 1)) as pool:
+            list(pool.map(write_one, accounts))
+
+        return len(accounts)
+
+    def serialize_account(self, account: SteamGuardAccount) -> bytes:
+        """maFile bytes for account, as written by save_mafile and export_mafile"""
+        return account.serialize(_dumps)
+
     def get_mafiles_directory(self) -> Path:
         """Get the maFiles directory path"""
         return self.mafiles_dir
@@ -169,22 +339,27 @@ class MaFileManager:
         self.mafiles_dir = new_dir
         logging.info(f"Changed maFiles directory to: {self.mafiles_dir}")
     
+    def _scan_mafile_entries(self, folder_path: Path, ignore_case: bool = False) -> List[os.DirEntry]:
+        """List the .maFile entries directly inside folder_path in one directory pass
+
+        DirEntry caches its stat() result, so callers can check mtime/size
+        without another lookup by path.
+        """
+        suffix = ".mafile" if ignore_case else ".maFile"
+        with os.scandir(folder_path) as entries:
+            return [entry for entry in entries
+                    if (entry.name.lower() if ignore_case else entry.name).endswith(suffix)
+                    and entry.is_file()]
+
+    def _find_mafiles(self, folder_path: Path, ignore_case: bool = False) -> List[Path]:
+        """List the .maFile files directly inside folder_path in one directory pass"""
+        return [Path(entry.path) for entry in self._scan_mafile_entries(folder_path, ignore_case)]
+
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize a string to be safe for use as filename"""
-        # Remove or replace unsafe characters
-        unsafe_chars = '<>:"/\\|?*'
-        safe_name = name
-        for char in unsafe_chars:
-            safe_name = safe_name.replace(char, '_')
-        
-        # Remove leading/trailing spaces and dots
-        safe_name = safe_name.strip('. ')
-        
-        # Ensure it's not empty
-        if not safe_name:
-            safe_name = "account"
-        
-        return safe_name
+        # Replace unsafe characters, then remove leading/trailing spaces and
+        # dots; fall back to a fixed name if nothing is left
+        return name.translate(_UNSAFE_FILENAME_CHARS).strip('. ') or "account"
     
     def import_sda_folder(self, folder_path: Path, passkey: Optional[str] = None) -> Tuple[List[SteamGuardAccount], List[str]]:
         """
@@ -236,7 +411,7 @@ class MaFileManager:
             return sda_imported
 
         # Find all .maFile files (case insensitive)
-        mafiles = list(folder_path.glob("*.maFile")) + list(folder_path.glob("*.mafile"))
+        mafiles = self._find_mafiles(folder_path, ignore_case=True)
 
         logging.info(f"Found {len(mafiles)} .maFile files in {folder_path}")
 
@@ -263,33 +438,46 @@ class MaFileManager:
             "encrypted": False
         }
 
+        required_fields = ['account_name', 'shared_secret']
+        recommended_fields = ['identity_secret', 'steamid']
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
+            with open(file_path, 'rb') as f:
+                head = f.read(_SNIFF_SIZE)
+            head = head.removeprefix(b'\xef\xbb\xbf').strip()
 
-            # Detect if file is SDA-encrypted (base64-encoded, not JSON)
-            try:
-                data = json.loads(content)
-            except json.JSONDecodeError:
-                # Could be SDA-encrypted (base64 ciphertext)
-                try:
-                    import base64
-                    base64.b64decode(content)
+            # A maFile is a JSON object; anything else is either SDA-encrypted
+            # (base64 ciphertext) or not a maFile at all
+            if not head.startswith(b'{'):
+                if head and not head.translate(None, _BASE64_ALPHABET):
                     result["encrypted"] = True
                     result["warnings"].append("File appears to be SDA-encrypted. Import via SDA folder with passkey.")
-                    return result
-                except Exception:
+                else:
+                    result["errors"].append("Invalid file format: not JSON and not encrypted")
+                return result
+
+            data = None
+            if ijson is not None:
+                try:
+                    data = self._read_top_level_fields(file_path, required_fields + recommended_fields)
+                except ijson.JSONError:
+                    pass  # Malformed; let the full parse report it
+
+            if data is None:
+                with open(file_path, 'rb') as f:
+                    content = f.read()
+                try:
+                    data = loads(content)
+                except json.JSONDecodeError:
                     result["errors"].append("Invalid file format: not JSON and not encrypted")
                     return result
 
             # Check required fields
-            required_fields = ['account_name', 'shared_secret']
             for field in required_fields:
                 if field not in data:
                     result["errors"].append(f"Missing required field: {field}")
 
             # Check recommended fields
-            recommended_fields = ['identity_secret', 'steamid']
             for field in recommended_fields:
                 if field not in data:
                     result["warnings"].append(f"Missing recommended field: {field} (needed for confirmations)")
@@ -304,4 +492,24 @@ class MaFileManager:
         except Exception as e:
             result["errors"].append(f"Error reading file: {e}")
 
-        return result
\ No newline at end of file
+        return result
+
+    def _read_top_level_fields(self, file_path: Path, fields: List[str]) -> Dict[str, Any]:
+        """Stream the top-level keys of a JSON object with ijson
+
+        Scalar values are kept; nested values are recorded as None. Reading
+        stops once every key in fields has been seen and steamid is set,
+        since nothing after that can change the validation result.
+        """
+        data = {}
+        key = None
+        with open(file_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == '' and event == 'map_key':
+                    key = value
+                    data[key] = None
+                elif prefix == key and event in ('string', 'number', 'boolean', 'null'):
+                    data[key] = value
+                    if data.get("steamid") and all(field in data for field in fields):
+                        break
+        return data
@@ -3,8 +3,11 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw, GLib, Gio, Gdk
+import aiohttp
 import asyncio
+import io
 import threading
+import zipfile
 from pathlib import Path
 
 # Get the icon path
@@ -17,10 +20,8 @@ from datetime import datetime
 
 from steam_guard import SteamGuardAccount
 from ui import MainWindow
-from mafile_manager import MaFileManager
-from login_dialog import LoginDialog
-from preferences import PreferencesManager, PreferencesWindow
-from setup_dialog import SetupDialog
+from mafile_manager import MaFileManager, loads, dumps_compact
+from preferences import PreferencesManager
 from sda_compat import is_sda_folder, read_sda_manifest, verify_sda_passkey, export_sda_accounts, import_sda_accounts
 
 # Set up logging
@@ -37,7 +38,117 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Shared layout of the custom themes; each one only differs in its colors
+_THEME_TEMPLATE = """
+    @define-color accent_color {accent};
+    @define-color accent_bg_color {accent};
+    @define-color accent_fg_color {accent_fg};
+    @define-color window_bg_color {window_bg};
+    @define-color view_bg_color {view_bg};
+    @define-color card_bg_color {card_bg};
+    @define-color headerbar_bg_color {view_bg};
+
+    window {{ background-color: {window_bg}; }}
+    .steam-code, .code-small, .code-medium, .code-large, .code-extra-large {{
+        color: {code};
+    }}
+    button.suggested-action {{
+        background: {button_bg};{button_fg}
+        border: 1px solid {button_border};
+    }}
+    .card {{ background-color: {card_bg}; border: 1px solid {card_border}; }}
+    headerbar {{ {headerbar_bg}; border-bottom: 1px solid {headerbar_border}; }}
+    .view, scrolledwindow > viewport {{ background-color: {view_bg}; }}
+"""
+
+# (window, view, card) background colors shared by the plain dark themes
+_DARK_BASE = ("#1a1a1a", "#242424", "#2a2a2a")
+
+
+def _theme_css(accent, base, button_bg, card_border, headerbar_border, accent_fg="#ffffff",
+               code=None, button_fg=None, button_border=None, headerbar_bg=None) -> bytes:
+    """Fill in _THEME_TEMPLATE; code color and button border default to the accent"""
+    window_bg, view_bg, card_bg = base
+    return _THEME_TEMPLATE.format(
+        accent=accent,
+        accent_fg=accent_fg,
+        window_bg=window_bg,
+        view_bg=view_bg,
+        card_bg=card_bg,
+        code=code or accent,
+        button_bg=button_bg,
+        button_fg=f"\n        color: {button_fg};" if button_fg else "",
+        button_border=button_border or accent,
+        card_border=card_border,
+        headerbar_bg=headerbar_bg or f"background-color: {view_bg}",
+        headerbar_border=headerbar_border,
+    ).encode()
+
+
+# Color scheme and custom CSS (None for the plain Adwaita look) per theme name
+_THEMES = {
+    "light": (Adw.ColorScheme.FORCE_LIGHT, None),
+    "dark": (Adw.ColorScheme.FORCE_DARK, None),
+    # Crimson (Red Neon) theme - dark background with red accents
+    "crimson": (Adw.ColorScheme.FORCE_DARK, _theme_css(
+        "#ff0040", _DARK_BASE, "linear-gradient(45deg, #cc0033, #ff0040)",
+        "rgba(255, 0, 64, 0.2)", "rgba(255, 0, 64, 0.3)")),
+    # Ocean (Blue) theme - dark background with blue accents
+    "ocean": (Adw.ColorScheme.FORCE_DARK, _theme_css(
+        "#00a8ff", _DARK_BASE, "linear-gradient(45deg, #0077b6, #00a8ff)",
+        "rgba(0, 168, 255, 0.2)", "rgba(0, 168, 255, 0.3)")),
+    # Forest (Green) theme - dark background with green accents
+    "forest": (Adw.ColorScheme.FORCE_DARK, _theme_css(
+        "#00d26a", _DARK_BASE, "linear-gradient(45deg, #00a854, #00d26a)",
+        "rgba(0, 210, 106, 0.2)", "rgba(0, 210, 106, 0.3)")),
+    # Purple (Violet) theme - dark background with purple accents
+    "purple": (Adw.ColorScheme.FORCE_DARK, _theme_css(
+        "#a855f7", _DARK_BASE, "linear-gradient(45deg, #7c3aed, #a855f7)",
+        "rgba(168, 85, 247, 0.2)", "rgba(168, 85, 247, 0.3)")),
+    # Sunset (Orange) theme - dark background with orange accents
+    "sunset": (Adw.ColorScheme.FORCE_DARK, _theme_css(
+        "#ff6b35", _DARK_BASE, "linear-gradient(45deg, #e65100, #ff6b35)",
+        "rgba(255, 107, 53, 0.2)", "rgba(255, 107, 53, 0.3)")),
+    # Nord theme
+    "nord": (Adw.ColorScheme.FORCE_DARK, _theme_css(
+        "#88c0d0", ("#2e3440", "#3b4252", "#434c5e"), "linear-gradient(45deg, #5e81ac, #88c0d0)",
+        "rgba(136, 192, 208, 0.15)", "rgba(136, 192, 208, 0.2)", accent_fg="#2e3440",
+        headerbar_bg="background: linear-gradient(90deg, #2e3440, #3b4252)")),
+    # Neon - hot pink/cyan cyberpunk theme
+    "neon": (Adw.ColorScheme.FORCE_DARK, _theme_css(
+        "#ff2d95", ("#0a0a12", "#12121f", "#1a1a2e"), "linear-gradient(45deg, #ff2d95, #00d4ff)",
+        "rgba(255, 45, 149, 0.2)", "rgba(255, 45, 149, 0.3)")),
+    # Sakura - cherry blossom pink light theme
+    "sakura": (Adw.ColorScheme.FORCE_LIGHT, _theme_css(
+        "#ec4899", ("#fdf2f8", "#fce7f3", "#fbcfe8"), "linear-gradient(45deg, #ec4899, #f472b6)",
+        "rgba(236, 72, 153, 0.2)", "rgba(236, 72, 153, 0.2)", code="#db2777")),
+    # Hacker - matrix green on black terminal style
+    "hacker": (Adw.ColorScheme.FORCE_DARK, _theme_css(
+        "#00ff41", ("#0d0d0d", "#111111", "#1a1a1a"), "#00ff41",
+        "rgba(0, 255, 65, 0.15)", "rgba(0, 255, 65, 0.2)", accent_fg="#000000",
+        button_fg="#000000")),
+    # Bubblegum - bright pastel purple/blue fun theme
+    "bubblegum": (Adw.ColorScheme.FORCE_LIGHT, _theme_css(
+        "#8b5cf6", ("#faf5ff", "#f3e8ff", "#e9d5ff"), "linear-gradient(45deg, #8b5cf6, #06b6d4)",
+        "rgba(139, 92, 246, 0.2)", "rgba(139, 92, 246, 0.2)", code="#7c3aed")),
+    # Minimal - clean grayscale, no distractions
+    "minimal": (Adw.ColorScheme.FORCE_LIGHT, _theme_css(
+        "#525252", ("#fafafa", "#f5f5f5", "#e5e5e5"), "#171717",
+        "#d4d4d4", "#d4d4d4", code="#171717", button_border="#171717")),
+}
+
+
+def _submit_passkey_dialog(entry, dialog, response_id):
+    """Enter in a passkey entry answers its dialog (see _build_passkey_dialog)"""
+    dialog.response(response_id)
+
+
 class SteamAuthenticatorApp(Adw.Application):
+    # Token refreshes allowed in flight at once during a bulk refresh
+    MAX_CONCURRENT_REFRESHES = 8
+    # Profile refresh requests within this window are fetched together
+    PROFILE_REFRESH_DELAY_MS = 500
+
     def __init__(self):
         super().__init__(
             application_id='gg.cs2central.SteamAuthenticator',
@@ -46,8 +157,28 @@ class SteamAuthenticatorApp(Adw.Application):
         self.mafile_manager = MaFileManager()
         self.preferences = PreferencesManager()
         self.accounts = []
+        self.accounts_by_name = {}
+        # Accounts added or removed while a maFiles scan runs, replayed onto
+        # its result: [("add" | "remove", account)], None when no scan runs
+        self.scan_account_edits = None
+        self.scans_in_flight = 0
         self.current_account = None
         self.main_window = None
+        # Current Steam Guard code per shared secret: {secret: (time_step, code)}
+        self.code_cache = {}
+        # Background asyncio loop for every Steam request in the app (main
+        # window and dialogs), started on first use
+        self.aio_loop = None
+        # HTTP session on that loop, shared so DNS, TCP and TLS state survive
+        # between requests and dialogs
+        self.http_session = None
+        # Parsed CSS provider per custom theme, built on first use
+        self.theme_providers = {}
+        # File dialog filter lists by (name, pattern), see get_file_filters()
+        self.file_filters = {}
+        # Accounts waiting for a batched profile refresh, by Steam ID
+        self.pending_profile_refreshes = {}
+        self.profile_refresh_source = 0
         
     def do_startup(self):
         Adw.Application.do_startup(self)
@@ -81,50 +212,189 @@ class SteamAuthenticatorApp(Adw.Application):
         if not self.main_window:
             self.main_window = MainWindow(application=self)
             
-            # Load accounts from maFiles
-            self.load_accounts()
-            self.main_window.set_accounts(self.accounts)
-            
-            # Load first account if available
-            if self.accounts:
-                self.current_account = self.accounts[0]
-                self.main_window.set_current_account(self.current_account)
+            # Load accounts from maFiles in the background, then select the
+            # first account if available
+            self._load_accounts_async(self.select_first_account)
             
             # Apply saved preferences
             self.apply_saved_preferences()
 
-            # Start the code update timer
+            # Refresh the countdown once a second (GLib batches these
+            # wakeups) and swap the code exactly when its window ends
             GLib.timeout_add_seconds(1, self.update_code)
+            self.schedule_code_rollover()
 
         self.main_window.present()
+
+    def do_shutdown(self):
+        loop = self.aio_loop
+        if loop is not None:
+            async def close_session():
+                if self.http_session is not None:
+                    await self.http_session.close()
+                    self.http_session = None
+
+            try:
+                asyncio.run_coroutine_threadsafe(close_session(), loop).result(timeout=2)
+            except Exception as e:
+                logging.warning(f"Could not close HTTP session: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            self.aio_loop = None
+        Adw.Application.do_shutdown(self)
     
-    def load_accounts(self):
-        """Load all accounts from maFiles directory"""
-        # Show loading progress for large account collections
+    def get_aio_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background asyncio loop, starting its thread the first time"""
+        if self.aio_loop is None:
+            self.aio_loop = asyncio.new_event_loop()
+            threading.Thread(target=self._run_aio_loop, args=(self.aio_loop,), daemon=True).start()
+        return self.aio_loop
+
+    @staticmethod
+    def _run_aio_loop(loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    async def get_http_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on the background loop"""
+        if self.http_session is None or self.http_session.closed:
+            connector = aiohttp.TCPConnector(limit=4, ttl_dns_cache=300, keepalive_timeout=60)
+            self.http_session = aiohttp.ClientSession(connector=connector)
+        return self.http_session
+
+    def run_background(self, coro, on_complete, error_label: str, error_result,
+                       priority=GLib.PRIORITY_DEFAULT_IDLE):
+        """Run coro on the background loop and pass its result to on_complete on the GTK thread
+
+        If the coroutine raises, the error is logged and on_complete gets error_result.
+        """
+        def done(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                logging.error(f"{error_label}: {e}")
+                result = error_result
+            GLib.idle_add(on_complete, result, priority=priority)
+
+        asyncio.run_coroutine_threadsafe(coro, self.get_aio_loop()).add_done_callback(done)
+
+    def _load_accounts_async(self, on_loaded=None):
+        """Load all accounts from maFiles directory on a worker thread
+
+        Reading and parsing the files stays off the GTK thread; the result is
+        applied there, after which on_loaded (if given) is called.
+        """
         mafiles_dir = self.mafile_manager.get_mafiles_directory()
-        logger.debug(f"Looking for .maFile files in: {mafiles_dir}")
-        
-        # Load accounts with progress indication
-        self.accounts = self.mafile_manager.scan_mafiles()
-        account_count = len(self.accounts)
+        logger.debug("Looking for .maFile files in: %s", mafiles_dir)
+
+        if self.scans_in_flight == 0:
+            self.scan_account_edits = []
+        self.scans_in_flight += 1
+
+        def scan():
+            accounts = self.mafile_manager.scan_mafiles()
+            GLib.idle_add(self._apply_loaded_accounts, accounts, on_loaded)
+
+        threading.Thread(target=scan, daemon=True).start()
+
+    def _apply_loaded_accounts(self, accounts, on_loaded=None):
+        """Install freshly scanned accounts (GTK thread)
+
+        Accounts added or removed since the scan began are applied on top, so
+        an import finished during the scan is not lost.
+        """
+        self.accounts = accounts
+        # Replaying edits an earlier result already has is harmless: both
+        # operations match accounts by maFile path
+        for kind, account in self.scan_account_edits:
+            if kind == "add":
+                self._merge_accounts([account])
+            else:
+                self._drop_account(account)
+        self.scans_in_flight -= 1
+        if self.scans_in_flight == 0:
+            self.scan_account_edits = None
+        self.update_account_list()
+        account_count = len(accounts)
         
         if account_count > 0:
-            logging.info(f"Successfully loaded {account_count} accounts from maFiles")
-            logger.info(f"Loaded {account_count} Steam accounts")
+            logger.info("Loaded %d Steam accounts from maFiles", account_count)
+
+            # Log account names for debugging (first 10 only to avoid spam),
+            # as one record and only when debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                shown = accounts if account_count <= 10 else accounts[:5]
+                lines = [f"  • {account.account_name}" for account in shown]
+                if account_count > len(shown):
+                    lines.append(f"  ... and {account_count - len(shown)} more accounts")
+                logger.debug("Accounts:\n%s", "\n".join(lines))
+        else:
+            logger.info(
+                "No .maFile files found. You can:\n"
+                "1. Copy your .maFile files to the maFiles directory\n"
+                "2. Use 'Add Account' to create a new account\n"
+                "3. Use 'Import Account' to import existing .maFile files"
+            )
 
-            # Log account names for debugging (first 10 only to avoid spam)
-            if account_count <= 10:
-                for account in self.accounts:
-                    logger.debug(f"  • {account.account_name}")
+        if on_loaded:
+            on_loaded()
+        return False
+
+    def add_accounts(self, new_accounts):
+        """Put newly saved accounts into the list without rescanning
+
+        An account saved over an existing maFile replaces that entry.
+        """
+        if self.scan_account_edits is not None:
+            self.scan_account_edits.extend(("add", account) for account in new_accounts)
+        self._merge_accounts(new_accounts)
+        self.update_account_list()
+
+    def _merge_accounts(self, new_accounts):
+        """Add new_accounts to self.accounts, replacing entries with the same maFile path"""
+        index_by_path = {account.mafile_path: i for i, account in enumerate(self.accounts)
+                         if getattr(account, 'mafile_path', None)}
+        for account in new_accounts:
+            path = getattr(account, 'mafile_path', None)
+            index = index_by_path.get(path) if path else None
+            if index is None:
+                if path:
+                    index_by_path[path] = len(self.accounts)
+                self.accounts.append(account)
             else:
-                for account in self.accounts[:5]:
-                    logger.debug(f"  • {account.account_name}")
-                logger.debug(f"  ... and {account_count - 5} more accounts")
+                self.accounts[index] = account
+
+    def remove_account(self, account):
+        """Drop a deleted account from the list without rescanning"""
+        if self.scan_account_edits is not None:
+            self.scan_account_edits.append(("remove", account))
+        self._drop_account(account)
+        self.update_account_list()
+
+    def _drop_account(self, account):
+        """Remove account, and any entry with the same maFile path, from self.accounts"""
+        path = getattr(account, 'mafile_path', None)
+        self.accounts = [a for a in self.accounts
+                         if a is not account and (path is None or getattr(a, 'mafile_path', None) != path)]
+
+    def update_account_list(self):
+        """Reindex self.accounts by name and show it in the main window"""
+        # Built back to front so the first account with a given name wins
+        self.accounts_by_name = {account.account_name: account for account in reversed(self.accounts)}
+        self.main_window.set_accounts(self.accounts)
+
+    def select_first_account(self):
+        """Select the first loaded account, if there is one"""
+        if self.accounts:
+            self.current_account = self.accounts[0]
+            self.main_window.set_current_account(self.current_account)
+
+    def select_first_or_no_account(self):
+        """Select the first loaded account, or show that none is selected"""
+        if self.accounts:
+            self.select_first_account()
         else:
-            logger.info("No .maFile files found. You can:")
-            logger.info("1. Copy your .maFile files to the maFiles directory")
-            logger.info("2. Use 'Add Account' to create a new account")
-            logger.info("3. Use 'Import Account' to import existing .maFile files")
+            self.current_account = None
+            self.main_window.set_current_account(None)
     
     def create_action(self, name, callback, shortcuts=None):
         action = Gio.SimpleAction.new(name, None)
@@ -133,12 +403,29 @@ class SteamAuthenticatorApp(Adw.Application):
         if shortcuts:
             self.set_accels_for_action(f'app.{name}', shortcuts)
     
+    def schedule_code_rollover(self):
+        """Arm a one-shot timer for the next 30-second code boundary"""
+        delay_ms = int((30 - time.time() % 30) * 1000) + 1
+        GLib.timeout_add(delay_ms, self.on_code_rollover)
+
+    def on_code_rollover(self):
+        # The 1 Hz tick can fire up to a second late; show the new code now
+        self.update_code()
+        self.schedule_code_rollover()
+        return False
+
     def update_code(self):
-        """Update Steam Guard code every second"""
+        """Update Steam Guard code and countdown (runs every second)"""
         if self.current_account and self.main_window:
-            code = self.current_account.generate_steam_guard_code()
-            time_left = self.current_account.get_time_until_next_code()
-            self.main_window.update_code_display(code, time_left)
+            # The code only changes every 30 seconds; reuse it within a window
+            now = int(time.time())
+            time_step = now // 30
+            secret = self.current_account.shared_secret
+            cached = self.code_cache.get(secret)
+            if cached is None or cached[0] != time_step:
+                cached = (time_step, self.current_account.generate_steam_guard_code(now))
+                self.code_cache[secret] = cached
+            self.main_window.update_code_display(cached[1], 30 - now % 30)
         return True
     
     def on_about_action(self, action, param):
@@ -161,6 +448,7 @@ class SteamAuthenticatorApp(Adw.Application):
         about.present()
     
     def on_preferences_action(self, action, param):
+        from preferences import PreferencesWindow
         preferences_window = PreferencesWindow(self.main_window, self.preferences)
         preferences_window.present()
     
@@ -179,6 +467,7 @@ class SteamAuthenticatorApp(Adw.Application):
     def on_setup_account_action(self, action, param):
         """Show setup dialog to link a new Steam account"""
         if self.main_window:
+            from setup_dialog import SetupDialog
             dialog = SetupDialog(parent=self.main_window)
             dialog.connect('account-created', self.on_account_setup_complete)
             dialog.present()
@@ -189,9 +478,7 @@ class SteamAuthenticatorApp(Adw.Application):
             account = SteamGuardAccount(account_data)
             self.mafile_manager.save_mafile(account)
 
-            # Reload accounts
-            self.load_accounts()
-            self.main_window.set_accounts(self.accounts)
+            self.add_accounts([account])
 
             # Select the new account
             self.current_account = account
@@ -219,36 +506,34 @@ class SteamAuthenticatorApp(Adw.Application):
     def on_remove_account_response(self, dialog, response):
         if response == "remove" and self.current_account:
             # Delete the maFile
-            self.mafile_manager.delete_mafile(self.current_account)
-            
-            # Reload accounts
-            self.load_accounts()
-            self.main_window.set_accounts(self.accounts)
+            if self.mafile_manager.delete_mafile(self.current_account):
+                self.remove_account(self.current_account)
             
             # Select another account or clear
-            if self.accounts:
-                self.current_account = self.accounts[0]
-                self.main_window.set_current_account(self.current_account)
-            else:
-                self.current_account = None
-                self.main_window.set_current_account(None)
+            self.select_first_or_no_account()
     
+    def get_file_filters(self, name: str, pattern: str) -> Gio.ListStore:
+        """File dialog filters for one file type plus "All Files", built once per type"""
+        filters = self.file_filters.get((name, pattern))
+        if filters is None:
+            file_filter = Gtk.FileFilter()
+            file_filter.set_name(name)
+            file_filter.add_pattern(pattern)
+
+            filter_all = Gtk.FileFilter()
+            filter_all.set_name("All Files")
+            filter_all.add_pattern("*")
+
+            filters = Gio.ListStore()
+            filters.append(file_filter)
+            filters.append(filter_all)
+            self.file_filters[(name, pattern)] = filters
+        return filters
+
     def on_import_account_action(self, action, param):
         dialog = Gtk.FileDialog()
         dialog.set_title("Import Account")
-        
-        filter_mafile = Gtk.FileFilter()
-        filter_mafile.set_name("Steam Authenticator Files")
-        filter_mafile.add_pattern("*.maFile")
-        
-        filter_all = Gtk.FileFilter()
-        filter_all.set_name("All Files")
-        filter_all.add_pattern("*")
-        
-        filters = Gio.ListStore()
-        filters.append(filter_mafile)
-        filters.append(filter_all)
-        dialog.set_filters(filters)
+        dialog.set_filters(self.get_file_filters("Steam Authenticator Files", "*.maFile"))
         
         dialog.open(self.main_window, None, self.on_import_file_selected)
     
@@ -267,9 +552,7 @@ class SteamAuthenticatorApp(Adw.Application):
                 # Import the maFile
                 account = self.mafile_manager.import_mafile(source_path)
                 if account:
-                    # Reload accounts
-                    self.load_accounts()
-                    self.main_window.set_accounts(self.accounts)
+                    self.add_accounts([account])
 
                     self.current_account = account
                     self.main_window.set_current_account(account)
@@ -309,9 +592,7 @@ class SteamAuthenticatorApp(Adw.Application):
                 imported_accounts = self.mafile_manager.import_mafiles_from_folder(folder_path)
 
                 if imported_accounts:
-                    # Reload accounts
-                    self.load_accounts()
-                    self.main_window.set_accounts(self.accounts)
+                    self.add_accounts(imported_accounts)
 
                     # Select the first imported account
                     self.current_account = imported_accounts[0]
@@ -329,34 +610,44 @@ class SteamAuthenticatorApp(Adw.Application):
             logging.error(f"Import folder error: {e}")
             self.main_window.show_toast("Could not import folder. Please try again.")
 
-    def _show_sda_passkey_dialog(self, folder_path: Path):
-        """Show a dialog to enter SDA encryption passkey."""
+    def _build_passkey_dialog(self, heading, body, response_id, response_label, placeholder):
+        """Build a message dialog with a passkey entry; Enter triggers response_id
+
+        Returns (dialog, entry). The caller connects "response" and presents it.
+        """
         dialog = Adw.MessageDialog(
             transient_for=self.main_window,
-            heading="Encrypted SDA Folder",
-            body="This folder contains encrypted Steam Desktop Authenticator files. Enter the encryption passkey to import them.",
+            heading=heading,
+            body=body,
         )
         dialog.add_response("cancel", "Cancel")
-        dialog.add_response("import", "Import")
-        dialog.set_response_appearance("import", Adw.ResponseAppearance.SUGGESTED)
-        dialog.set_default_response("import")
+        dialog.add_response(response_id, response_label)
+        dialog.set_response_appearance(response_id, Adw.ResponseAppearance.SUGGESTED)
+        dialog.set_default_response(response_id)
         dialog.set_close_response("cancel")
 
-        # Add passkey entry
-        entry = Gtk.PasswordEntry()
-        entry.set_show_peek_icon(True)
-        entry.props.placeholder_text = "SDA Encryption Passkey"
-        entry.set_hexpand(True)
-        entry.add_css_class("card")
-        entry.set_margin_start(24)
-        entry.set_margin_end(24)
-        entry.set_margin_top(8)
-
+        entry = Gtk.PasswordEntry(
+            show_peek_icon=True,
+            placeholder_text=placeholder,
+            hexpand=True,
+            css_classes=["card"],
+            margin_start=24,
+            margin_end=24,
+            margin_top=8,
+        )
         # Allow Enter key to submit
-        entry.connect("activate", lambda _: dialog.response("import"))
+        entry.connect("activate", _submit_passkey_dialog, dialog, response_id)
 
         dialog.set_extra_child(entry)
+        return dialog, entry
 
+    def _show_sda_passkey_dialog(self, folder_path: Path):
+        """Show a dialog to enter SDA encryption passkey."""
+        dialog, entry = self._build_passkey_dialog(
+            "Encrypted SDA Folder",
+            "This folder contains encrypted Steam Desktop Authenticator files. Enter the encryption passkey to import them.",
+            "import", "Import", "SDA Encryption Passkey",
+        )
         dialog.connect("response", self._on_sda_passkey_response, folder_path, entry)
         dialog.present()
         entry.grab_focus()
@@ -381,8 +672,7 @@ class SteamAuthenticatorApp(Adw.Application):
             imported, errors = self.mafile_manager.import_sda_folder(folder_path, passkey)
 
             if imported:
-                self.load_accounts()
-                self.main_window.set_accounts(self.accounts)
+                self.add_accounts(imported)
 
                 self.current_account = imported[0]
                 self.main_window.set_current_account(self.current_account)
@@ -406,28 +696,11 @@ class SteamAuthenticatorApp(Adw.Application):
             return
 
         # Show passkey dialog
-        dialog = Adw.MessageDialog(
-            transient_for=self.main_window,
-            heading="Export Backup",
-            body="Enter a passkey to encrypt the backup. Leave blank to export without encryption.\n\nCompatible with Hour Boost.",
+        dialog, entry = self._build_passkey_dialog(
+            "Export Backup",
+            "Enter a passkey to encrypt the backup. Leave blank to export without encryption.\n\nCompatible with Hour Boost.",
+            "export", "Export", "Passkey",
         )
-        dialog.add_response("cancel", "Cancel")
-        dialog.add_response("export", "Export")
-        dialog.set_response_appearance("export", Adw.ResponseAppearance.SUGGESTED)
-        dialog.set_default_response("export")
-        dialog.set_close_response("cancel")
-
-        entry = Gtk.PasswordEntry()
-        entry.set_show_peek_icon(True)
-        entry.props.placeholder_text = "Passkey"
-        entry.set_hexpand(True)
-        entry.add_css_class("card")
-        entry.set_margin_start(24)
-        entry.set_margin_end(24)
-        entry.set_margin_top(8)
-        entry.connect("activate", lambda _: dialog.response("export"))
-
-        dialog.set_extra_child(entry)
         dialog.connect("response", self._on_export_encrypted_passkey_response, entry)
         dialog.present()
         entry.grab_focus()
@@ -444,7 +717,7 @@ class SteamAuthenticatorApp(Adw.Application):
         suffix = "encrypted-" if passkey else ""
         file_dialog = Gtk.FileDialog()
         file_dialog.set_title("Save Backup")
-        file_dialog.set_initial_name(f"maFiles-{suffix}{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip")
+        file_dialog.set_initial_name(f"maFiles-{suffix}{time.strftime('%Y%m%d_%H%M%S')}.zip")
         file_dialog.save(self.main_window, None, self._on_export_encrypted_file_selected)
 
     def _on_export_encrypted_file_selected(self, dialog, result):
@@ -454,7 +727,6 @@ class SteamAuthenticatorApp(Adw.Application):
             if not file:
                 return
 
-            import zipfile
             dest_path = Path(file.get_path())
             passkey = getattr(self, '_export_passkey', None)
             if hasattr(self, '_export_passkey'):
@@ -466,8 +738,12 @@ class SteamAuthenticatorApp(Adw.Application):
             # Export using SDA-compatible encryption
             manifest, files = export_sda_accounts(account_dicts, passkey)
 
-            with zipfile.ZipFile(dest_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                zipf.writestr("manifest.json", json.dumps(manifest, indent=2))
+            # Ciphertext doesn't compress, so only deflate plaintext exports
+            # (the manifest is always plain JSON)
+            compression = zipfile.ZIP_STORED if passkey else zipfile.ZIP_DEFLATED
+            with zipfile.ZipFile(dest_path, 'w', compression) as zipf:
+                zipf.writestr("manifest.json", json.dumps(manifest, indent=2),
+                              compress_type=zipfile.ZIP_DEFLATED)
                 for filename, content in files.items():
                     zipf.writestr(filename, content)
 
@@ -487,19 +763,7 @@ class SteamAuthenticatorApp(Adw.Application):
         """Import encrypted SDA-compatible maFiles ZIP"""
         dialog = Gtk.FileDialog()
         dialog.set_title("Import Encrypted Backup")
-
-        filter_zip = Gtk.FileFilter()
-        filter_zip.set_name("Encrypted Backup (*.zip)")
-        filter_zip.add_pattern("*.zip")
-
-        filter_all = Gtk.FileFilter()
-        filter_all.set_name("All Files")
-        filter_all.add_pattern("*")
-
-        filters = Gio.ListStore()
-        filters.append(filter_zip)
-        filters.append(filter_all)
-        dialog.set_filters(filters)
+        dialog.set_filters(self.get_file_filters("Encrypted Backup (*.zip)", "*.zip"))
 
         dialog.open(self.main_window, None, self._on_import_encrypted_file_selected)
 
@@ -510,7 +774,6 @@ class SteamAuthenticatorApp(Adw.Application):
             if not file:
                 return
 
-            import zipfile
             source_path = Path(file.get_path())
 
             # Verify it's a valid SDA-format ZIP (has manifest.json)
@@ -519,7 +782,7 @@ class SteamAuthenticatorApp(Adw.Application):
                     if 'manifest.json' not in zipf.namelist():
                         self.main_window.show_toast("Not a valid encrypted backup (no manifest.json)")
                         return
-                    manifest = json.loads(zipf.read('manifest.json').decode('utf-8'))
+                    manifest = loads(zipf.read('manifest.json'))
             except zipfile.BadZipFile:
                 self.main_window.show_toast("Invalid ZIP file")
                 return
@@ -546,28 +809,11 @@ class SteamAuthenticatorApp(Adw.Application):
 
     def _show_import_encrypted_passkey_dialog(self):
         """Show passkey dialog for importing encrypted backup"""
-        dialog = Adw.MessageDialog(
-            transient_for=self.main_window,
-            heading="Encrypted Backup",
-            body="This backup is encrypted. Enter the passkey used when exporting.",
+        dialog, entry = self._build_passkey_dialog(
+            "Encrypted Backup",
+            "This backup is encrypted. Enter the passkey used when exporting.",
+            "import", "Import", "Decryption Passkey",
         )
-        dialog.add_response("cancel", "Cancel")
-        dialog.add_response("import", "Import")
-        dialog.set_response_appearance("import", Adw.ResponseAppearance.SUGGESTED)
-        dialog.set_default_response("import")
-        dialog.set_close_response("cancel")
-
-        entry = Gtk.PasswordEntry()
-        entry.set_show_peek_icon(True)
-        entry.props.placeholder_text = "Decryption Passkey"
-        entry.set_hexpand(True)
-        entry.add_css_class("card")
-        entry.set_margin_start(24)
-        entry.set_margin_end(24)
-        entry.set_margin_top(8)
-        entry.connect("activate", lambda _: dialog.response("import"))
-
-        dialog.set_extra_child(entry)
         dialog.connect("response", self._on_import_encrypted_passkey_response, entry)
         dialog.present()
         entry.grab_focus()
@@ -591,45 +837,43 @@ class SteamAuthenticatorApp(Adw.Application):
 
     def _do_import_encrypted_zip(self, source_path: Path, passkey):
         """Actually import accounts from an SDA-format ZIP"""
-        import zipfile
-        import tempfile
-
         try:
-            # Extract ZIP to temp dir, then use import_sda_accounts
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmpdir_path = Path(tmpdir)
-                with zipfile.ZipFile(source_path, 'r') as zipf:
-                    zipf.extractall(tmpdir)
+            # Read members straight into memory; no temp dir round-trip
+            with zipfile.ZipFile(source_path, 'r') as zipf:
+                files = {name: zipf.read(name) for name in zipf.namelist()
+                         if not name.endswith('/')}
 
-                accounts, errors = import_sda_accounts(tmpdir_path, passkey)
+            accounts, errors = import_sda_accounts(files, passkey)
 
-                if not accounts and errors:
-                    error_msg = errors[0] if errors else "Unknown error"
-                    self.main_window.show_toast(f"Import failed: {error_msg}")
-                    return
+            if not accounts and errors:
+                error_msg = errors[0] if errors else "Unknown error"
+                self.main_window.show_toast(f"Import failed: {error_msg}")
+                return
 
-                imported = []
-                for account_data in accounts:
-                    try:
-                        account = SteamGuardAccount(account_data)
-                        self.mafile_manager.save_mafile(account)
-                        imported.append(account)
-                    except Exception as e:
-                        name = account_data.get("account_name", "unknown")
-                        errors.append(f"Failed to save {name}: {e}")
-
-                if imported:
-                    self.load_accounts()
-                    self.main_window.set_accounts(self.accounts)
-                    self.current_account = imported[0]
-                    self.main_window.set_current_account(self.current_account)
+            imported = []
+            for account_data in accounts:
+                try:
+                    # The decrypted dict is written as-is; the account object
+                    # is only needed for the list and the file name
+                    account = SteamGuardAccount(account_data)
+                    account.mafile_path = self.mafile_manager.save_raw(
+                        account_data, self.mafile_manager.mafile_filename(account))
+                    imported.append(account)
+                except Exception as e:
+                    name = account_data.get("account_name", "unknown")
+                    errors.append(f"Failed to save {name}: {e}")
 
-                    msg = f"Imported {len(imported)} accounts"
-                    if errors:
-                        msg += f" ({len(errors)} errors)"
-                    self.main_window.show_toast(msg)
-                else:
-                    self.main_window.show_toast("No accounts could be imported")
+            if imported:
+                self.add_accounts(imported)
+                self.current_account = imported[0]
+                self.main_window.set_current_account(self.current_account)
+
+                msg = f"Imported {len(imported)} accounts"
+                if errors:
+                    msg += f" ({len(errors)} errors)"
+                self.main_window.show_toast(msg)
+            else:
+                self.main_window.show_toast("No accounts could be imported")
 
         except Exception as e:
             logging.error(f"Import encrypted ZIP error: {e}")
@@ -652,13 +896,7 @@ class SteamAuthenticatorApp(Adw.Application):
                 return
 
             dest_path = Path(folder.get_path())
-            count = 0
-            for account in self.accounts:
-                filename = f"{account.steamid or account.account_name}.maFile"
-                file_path = dest_path / filename
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(account.to_dict(), f, indent=2)
-                count += 1
+            count = self.mafile_manager.export_mafiles(self.accounts, dest_path)
 
             self.main_window.show_toast(f"Exported {count} accounts to folder")
             logging.info(f"Exported {count} accounts as plaintext maFiles to {dest_path}")
@@ -708,20 +946,23 @@ class SteamAuthenticatorApp(Adw.Application):
 
         dialog = Gtk.FileDialog()
         dialog.set_title("Backup All Accounts")
-        dialog.set_initial_name(f"steam_authenticator_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip")
+        dialog.set_initial_name(f"steam_authenticator_backup_{time.strftime('%Y%m%d_%H%M%S')}.zip")
         dialog.save(self.main_window, None, self.on_backup_file_selected)
 
     def on_backup_file_selected(self, dialog, result):
         try:
             file = dialog.save_finish(result)
             if file:
-                import zipfile
                 dest_path = Path(file.get_path())
 
-                with zipfile.ZipFile(dest_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                # Buffer the archive in 1 MiB chunks instead of the default
+                # 8 KiB so many small entries don't mean many small writes
+                with open(dest_path, 'wb', buffering=0) as raw, \
+                        io.BufferedWriter(raw, buffer_size=1 << 20) as buf, \
+                        zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as zipf:
                     # Add each account's maFile
                     for account in self.accounts:
-                        account_data = json.dumps(account.to_dict(), indent=2)
+                        account_data = self.mafile_manager.serialize_account(account)
                         filename = f"{account.steamid or account.account_name}.maFile"
                         zipf.writestr(filename, account_data)
 
@@ -731,7 +972,7 @@ class SteamAuthenticatorApp(Adw.Application):
                         "account_count": len(self.accounts),
                         "accounts": [{"name": a.account_name, "steamid": a.steamid} for a in self.accounts]
                     }
-                    zipf.writestr("backup_manifest.json", json.dumps(manifest, indent=2))
+                    zipf.writestr("backup_manifest.json", dumps_compact(manifest))
 
                 self.main_window.show_toast(f"Backup complete - {len(self.accounts)} accounts saved")
         except GLib.Error as e:
@@ -747,19 +988,7 @@ class SteamAuthenticatorApp(Adw.Application):
         """Restore accounts from a backup zip file"""
         dialog = Gtk.FileDialog()
         dialog.set_title("Restore Backup")
-
-        filter_zip = Gtk.FileFilter()
-        filter_zip.set_name("Backup Files (*.zip)")
-        filter_zip.add_pattern("*.zip")
-
-        filter_all = Gtk.FileFilter()
-        filter_all.set_name("All Files")
-        filter_all.add_pattern("*")
-
-        filters = Gio.ListStore()
-        filters.append(filter_zip)
-        filters.append(filter_all)
-        dialog.set_filters(filters)
+        dialog.set_filters(self.get_file_filters("Backup Files (*.zip)", "*.zip"))
 
         dialog.open(self.main_window, None, self.on_restore_file_selected)
 
@@ -767,29 +996,29 @@ class SteamAuthenticatorApp(Adw.Application):
         try:
             file = dialog.open_finish(result)
             if file:
-                import zipfile
                 source_path = Path(file.get_path())
 
-                restored_count = 0
+                restored = []
                 with zipfile.ZipFile(source_path, 'r') as zipf:
-                    for name in zipf.namelist():
-                        if name.endswith('.maFile'):
-                            # Extract and import the maFile
-                            data = zipf.read(name)
-                            account_data = json.loads(data.decode('utf-8'))
-
-                            from steam_guard import SteamGuardAccount
-                            account = SteamGuardAccount(account_data)
-                            self.mafile_manager.save_mafile(account)
-                            restored_count += 1
-
-                # Reload accounts
-                self.load_accounts()
-                self.main_window.set_accounts(self.accounts)
-
-                if self.accounts:
-                    self.current_account = self.accounts[0]
-                    self.main_window.set_current_account(self.current_account)
+                    for info in zipf.infolist():
+                        # Skip other files, empty entries and password-protected
+                        # entries (which would fail to read anyway)
+                        if (not info.filename.endswith('.maFile') or info.file_size == 0
+                                or info.flag_bits & 0x1):
+                            continue
+                        # Parse the maFile straight from the member's bytes;
+                        # reading by ZipInfo skips another name lookup
+                        account_data = loads(zipf.read(info))
+                        restored.append(SteamGuardAccount(account_data))
+
+                self.mafile_manager.save_mafiles_bulk(restored)
+                restored_count = len(restored)
+
+                # The restored accounts are already parsed; merge them into
+                # the list instead of rescanning the maFiles directory
+                if restored:
+                    self.add_accounts(restored)
+                    self.select_first_account()
 
                 if restored_count > 0:
                     self.main_window.show_toast(f"Restored {restored_count} accounts")
@@ -808,11 +1037,10 @@ class SteamAuthenticatorApp(Adw.Application):
     
     def switch_account(self, account_name: str):
         """Switch to a different account"""
-        for account in self.accounts:
-            if account.account_name == account_name:
-                self.current_account = account
-                self.main_window.set_current_account(account)
-                break
+        account = self.accounts_by_name.get(account_name)
+        if account:
+            self.current_account = account
+            self.main_window.set_current_account(account)
     
     def add_new_account(self, account_data: dict):
         """Add a new account and save as maFile"""
@@ -820,9 +1048,7 @@ class SteamAuthenticatorApp(Adw.Application):
             account = SteamGuardAccount(account_data)
             self.mafile_manager.save_mafile(account)
             
-            # Reload accounts
-            self.load_accounts()
-            self.main_window.set_accounts(self.accounts)
+            self.add_accounts([account])
             
             self.current_account = account
             self.main_window.set_current_account(account)
@@ -838,50 +1064,49 @@ class SteamAuthenticatorApp(Adw.Application):
             self.main_window.show_toast("No account selected")
             return
         
-        # Run refresh in background
-        def refresh_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            async def do_refresh():
-                refreshed_count = 0
-                
-                for account in self.accounts:
-                    refresh_token = account.session_data.get("refresh_token")
-                    if refresh_token:
-                        logging.info(f"Attempting to refresh token for {account.account_name}")
-                        from steam_protobuf_login import SteamProtobufLogin
-                        async with SteamProtobufLogin() as steam_login:
-                            new_token = await steam_login.refresh_access_token(
-                                refresh_token,
-                                int(account.steamid)
-                            )
-                            if new_token:
-                                account.session_data["access_token"] = new_token
-                                account.session_data["token_timestamp"] = int(time.time())
-                                # Save updated account
-                                self.mafile_manager.save_mafile(account)
-                                refreshed_count += 1
-                                logging.info(f"Successfully refreshed token for {account.account_name}")
-                            else:
-                                logging.warning(f"Failed to refresh token for {account.account_name}")
-                    else:
-                        logging.info(f"No refresh token available for {account.account_name}")
-                
-                return refreshed_count
-            
-            try:
-                count = loop.run_until_complete(do_refresh())
-                GLib.idle_add(self.handle_bulk_token_refresh_result, count)
-            except Exception as e:
-                logging.error(f"Token refresh error: {e}")
-                GLib.idle_add(self.handle_bulk_token_refresh_result, 0)
-            finally:
-                loop.close()
-        
-        thread = threading.Thread(target=refresh_thread)
-        thread.daemon = True
-        thread.start()
+        # Run refresh on the app's background loop
+        async def do_refresh():
+            from steam_protobuf_login import SteamProtobufLogin
+
+            # Refresh accounts concurrently, a few at a time so Steam
+            # doesn't rate-limit us
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REFRESHES)
+
+            async def refresh_one(steam_login, account):
+                refresh_token = account.session_data.get("refresh_token")
+                if not refresh_token:
+                    logging.info(f"No refresh token available for {account.account_name}")
+                    return 0
+
+                async with semaphore:
+                    logging.info(f"Attempting to refresh token for {account.account_name}")
+                    new_token = await steam_login.refresh_access_token(
+                        refresh_token,
+                        int(account.steamid)
+                    )
+                if new_token:
+                    account.session_data["access_token"] = new_token
+                    account.session_data["token_timestamp"] = int(time.time())
+                    # Save updated account
+                    self.mafile_manager.save_mafile(account)
+                    logging.info(f"Successfully refreshed token for {account.account_name}")
+                    return 1
+                logging.warning(f"Failed to refresh token for {account.account_name}")
+                return 0
+
+            accounts = list(self.accounts)
+            # One session for the whole batch so connections are reused
+            async with SteamProtobufLogin() as steam_login:
+                results = await asyncio.gather(
+                    *(refresh_one(steam_login, account) for account in accounts),
+                    return_exceptions=True
+                )
+            for account, result in zip(accounts, results):
+                if isinstance(result, Exception):
+                    logging.error(f"Token refresh error for {account.account_name}: {result}")
+            return sum(result for result in results if isinstance(result, int))
+
+        self.run_background(do_refresh(), self.handle_bulk_token_refresh_result, "Token refresh error", 0)
         
         self.main_window.show_toast("Refreshing account sessions...")
     
@@ -903,6 +1128,7 @@ class SteamAuthenticatorApp(Adw.Application):
             return
         
         # Show the Steam login dialog with protobuf support
+        from login_dialog import LoginDialog
         dialog = LoginDialog(self.main_window, account=self.current_account)
         dialog.present()
         
@@ -934,59 +1160,82 @@ class SteamAuthenticatorApp(Adw.Application):
             self.main_window.show_toast("Steam API key not configured - check Preferences")
             return
 
-        # Run refresh in background
-        def refresh_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        self.queue_profile_refresh(self.current_account)
 
-            async def do_refresh():
-                from steam_web_api import SteamWebAPI
-                async with SteamWebAPI(api_key) as api:
-                    data = await api.fetch_all_player_data(self.current_account.steamid)
+        self.main_window.show_toast("Refreshing profile data...")
 
-                    if data["summary"]:
-                        self.current_account.display_name = data["summary"].get("display_name", "")
-                        self.current_account.avatar_url = data["summary"].get("avatar_url", "")
-                        self.current_account.profile_visibility = data["summary"].get("visibility", 0)
+    def queue_profile_refresh(self, account):
+        """Refresh account's profile with any others requested within PROFILE_REFRESH_DELAY_MS
 
-                    if data["games"]:
-                        self.current_account.total_games = len(data["games"])
+        Back-to-back requests (e.g. several logins in a row) share one
+        batch on the background loop instead of each starting its own.
+        """
+        self.pending_profile_refreshes[account.steamid] = account
+        if not self.profile_refresh_source:
+            self.profile_refresh_source = GLib.timeout_add(
+                self.PROFILE_REFRESH_DELAY_MS, self.flush_profile_refreshes
+            )
 
-                    if data["bans"]:
-                        self.current_account.vac_banned = data["bans"].get("vac_banned", False)
-                        self.current_account.trade_banned = data["bans"].get("trade_banned", False)
-                        self.current_account.game_bans = data["bans"].get("game_bans", 0)
+    def flush_profile_refreshes(self):
+        """Fetch profile data for every queued account in one batch"""
+        self.profile_refresh_source = 0
+        accounts = list(self.pending_profile_refreshes.values())
+        self.pending_profile_refreshes.clear()
+        api_key = self.preferences.get("steam_api_key", "")
 
-                    # Update last refresh timestamp
-                    self.current_account.last_api_refresh = datetime.now().isoformat()
+        async def refresh_one(api, account):
+            data = await api.fetch_all_player_data(account.steamid)
 
-                    # Save updated account
-                    self.mafile_manager.save_mafile(self.current_account)
+            if data["summary"]:
+                account.display_name = data["summary"].get("display_name", "")
+                account.avatar_url = data["summary"].get("avatar_url", "")
+                account.profile_visibility = data["summary"].get("visibility", 0)
 
-                    return data["summary"] is not None
+            if data["games"]:
+                account.total_games = len(data["games"])
 
-            try:
-                success = loop.run_until_complete(do_refresh())
-                GLib.idle_add(self.handle_profile_refresh_result, success)
-            except Exception as e:
-                logging.error(f"Profile refresh error: {e}")
-                GLib.idle_add(self.handle_profile_refresh_result, False)
-            finally:
-                loop.close()
+            if data["bans"]:
+                account.vac_banned = data["bans"].get("vac_banned", False)
+                account.trade_banned = data["bans"].get("trade_banned", False)
+                account.game_bans = data["bans"].get("game_bans", 0)
 
-        thread = threading.Thread(target=refresh_thread)
-        thread.daemon = True
-        thread.start()
+            # Update last refresh timestamp
+            account.last_api_refresh = datetime.now().isoformat()
 
-        self.main_window.show_toast("Refreshing profile data...")
+            # Save updated account
+            self.mafile_manager.save_mafile(account)
 
-    def handle_profile_refresh_result(self, success):
-        """Handle profile refresh result"""
-        if success:
+            return data["summary"] is not None
+
+        async def do_refresh():
+            from steam_web_api import SteamWebAPI
+            # One API session for the whole batch
+            async with SteamWebAPI(api_key) as api:
+                results = await asyncio.gather(
+                    *(refresh_one(api, account) for account in accounts),
+                    return_exceptions=True
+                )
+            for account, result in zip(accounts, results):
+                if isinstance(result, Exception):
+                    logging.error(f"Profile refresh error for {account.account_name}: {result}")
+            return [account for account, result in zip(accounts, results) if result is True]
+
+        self.run_background(do_refresh(), self.handle_profile_refresh_result, "Profile refresh error", [])
+        return False
+
+    def handle_profile_refresh_result(self, refreshed):
+        """Handle profile refresh result (the accounts that were updated)"""
+        if refreshed:
             # Update UI with new data
-            self.main_window.set_current_account(self.current_account)
-            self.main_window.show_toast(f"Profile updated: {self.current_account.display_name or self.current_account.account_name}")
-            logging.info(f"Successfully refreshed profile for {self.current_account.account_name}")
+            if self.current_account in refreshed:
+                self.main_window.set_current_account(self.current_account)
+            if len(refreshed) == 1:
+                account = refreshed[0]
+                self.main_window.show_toast(f"Profile updated: {account.display_name or account.account_name}")
+            else:
+                self.main_window.show_toast(f"Updated {len(refreshed)} profiles")
+            for account in refreshed:
+                logging.info(f"Successfully refreshed profile for {account.account_name}")
         else:
             self.main_window.show_toast("Could not refresh profile. Check API key.")
             logging.warning("Profile refresh failed")
@@ -1062,43 +1311,12 @@ class SteamAuthenticatorApp(Adw.Application):
         # First clear any existing custom theme
         self.clear_custom_theme()
 
-        if theme_name == "light":
-            style_manager.set_color_scheme(Adw.ColorScheme.FORCE_LIGHT)
-        elif theme_name == "dark":
-            style_manager.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
-        elif theme_name == "crimson":
-            style_manager.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
-            self.apply_custom_theme(self.get_crimson_css())
-        elif theme_name == "ocean":
-            style_manager.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
-            self.apply_custom_theme(self.get_ocean_css())
-        elif theme_name == "forest":
-            style_manager.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
-            self.apply_custom_theme(self.get_forest_css())
-        elif theme_name == "purple":
-            style_manager.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
-            self.apply_custom_theme(self.get_purple_css())
-        elif theme_name == "sunset":
-            style_manager.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
-            self.apply_custom_theme(self.get_sunset_css())
-        elif theme_name == "nord":
-            style_manager.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
-            self.apply_custom_theme(self.get_nord_css())
-        elif theme_name == "neon":
-            style_manager.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
-            self.apply_custom_theme(self.get_neon_css())
-        elif theme_name == "sakura":
-            style_manager.set_color_scheme(Adw.ColorScheme.FORCE_LIGHT)
-            self.apply_custom_theme(self.get_sakura_css())
-        elif theme_name == "hacker":
-            style_manager.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
-            self.apply_custom_theme(self.get_hacker_css())
-        elif theme_name == "bubblegum":
-            style_manager.set_color_scheme(Adw.ColorScheme.FORCE_LIGHT)
-            self.apply_custom_theme(self.get_bubblegum_css())
-        elif theme_name == "minimal":
-            style_manager.set_color_scheme(Adw.ColorScheme.FORCE_LIGHT)
-            self.apply_custom_theme(self.get_minimal_css())
+        if theme_name not in _THEMES:
+            return
+        scheme, css_data = _THEMES[theme_name]
+        style_manager.set_color_scheme(scheme)
+        if css_data:
+            self.apply_custom_theme(theme_name)
     
     def clear_custom_theme(self):
         """Remove custom theme CSS"""
@@ -1109,10 +1327,14 @@ class SteamAuthenticatorApp(Adw.Application):
             )
             self.custom_css_provider = None
 
-    def apply_custom_theme(self, css_data):
-        """Apply a custom theme CSS"""
-        self.custom_css_provider = Gtk.CssProvider()
-        self.custom_css_provider.load_from_data(css_data)
+    def apply_custom_theme(self, theme_name):
+        """Apply a custom theme's CSS, parsing it only the first time it is used"""
+        provider = self.theme_providers.get(theme_name)
+        if provider is None:
+            provider = Gtk.CssProvider()
+            provider.load_from_data(_THEMES[theme_name][1])
+            self.theme_providers[theme_name] = provider
+        self.custom_css_provider = provider
 
         if self.main_window:
             Gtk.StyleContext.add_provider_for_display(
@@ -1121,272 +1343,6 @@ class SteamAuthenticatorApp(Adw.Application):
                 Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
             )
 
-    def get_crimson_css(self):
-        """Crimson (Red Neon) theme - dark background with red accents"""
-        return b"""
-            @define-color accent_color #ff0040;
-            @define-color accent_bg_color #ff0040;
-            @define-color accent_fg_color #ffffff;
-            @define-color window_bg_color #1a1a1a;
-            @define-color view_bg_color #242424;
-            @define-color card_bg_color #2a2a2a;
-            @define-color headerbar_bg_color #242424;
-
-            window { background-color: #1a1a1a; }
-            .steam-code, .code-small, .code-medium, .code-large, .code-extra-large {
-                color: #ff0040;
-            }
-            button.suggested-action {
-                background: linear-gradient(45deg, #cc0033, #ff0040);
-                border: 1px solid #ff0040;
-            }
-            .card { background-color: #2a2a2a; border: 1px solid rgba(255, 0, 64, 0.2); }
-            headerbar { background-color: #242424; border-bottom: 1px solid rgba(255, 0, 64, 0.3); }
-            .view, scrolledwindow > viewport { background-color: #242424; }
-        """
-
-    def get_ocean_css(self):
-        """Ocean (Blue) theme - dark background with blue accents"""
-        return b"""
-            @define-color accent_color #00a8ff;
-            @define-color accent_bg_color #00a8ff;
-            @define-color accent_fg_color #ffffff;
-            @define-color window_bg_color #1a1a1a;
-            @define-color view_bg_color #242424;
-            @define-color card_bg_color #2a2a2a;
-            @define-color headerbar_bg_color #242424;
-
-            window { background-color: #1a1a1a; }
-            .steam-code, .code-small, .code-medium, .code-large, .code-extra-large {
-                color: #00a8ff;
-            }
-            button.suggested-action {
-                background: linear-gradient(45deg, #0077b6, #00a8ff);
-                border: 1px solid #00a8ff;
-            }
-            .card { background-color: #2a2a2a; border: 1px solid rgba(0, 168, 255, 0.2); }
-            headerbar { background-color: #242424; border-bottom: 1px solid rgba(0, 168, 255, 0.3); }
-            .view, scrolledwindow > viewport { background-color: #242424; }
-        """
-
-    def get_forest_css(self):
-        """Forest (Green) theme - dark background with green accents"""
-        return b"""
-            @define-color accent_color #00d26a;
-            @define-color accent_bg_color #00d26a;
-            @define-color accent_fg_color #ffffff;
-            @define-color window_bg_color #1a1a1a;
-            @define-color view_bg_color #242424;
-            @define-color card_bg_color #2a2a2a;
-            @define-color headerbar_bg_color #242424;
-
-            window { background-color: #1a1a1a; }
-            .steam-code, .code-small, .code-medium, .code-large, .code-extra-large {
-                color: #00d26a;
-            }
-            button.suggested-action {
-                background: linear-gradient(45deg, #00a854, #00d26a);
-                border: 1px solid #00d26a;
-            }
-            .card { background-color: #2a2a2a; border: 1px solid rgba(0, 210, 106, 0.2); }
-            headerbar { background-color: #242424; border-bottom: 1px solid rgba(0, 210, 106, 0.3); }
-            .view, scrolledwindow > viewport { background-color: #242424; }
-        """
-
-    def get_purple_css(self):
-        """Purple (Violet) theme - dark background with purple accents"""
-        return b"""
-            @define-color accent_color #a855f7;
-            @define-color accent_bg_color #a855f7;
-            @define-color accent_fg_color #ffffff;
-            @define-color window_bg_color #1a1a1a;
-            @define-color view_bg_color #242424;
-            @define-color card_bg_color #2a2a2a;
-            @define-color headerbar_bg_color #242424;
-
-            window { background-color: #1a1a1a; }
-            .steam-code, .code-small, .code-medium, .code-large, .code-extra-large {
-                color: #a855f7;
-            }
-            button.suggested-action {
-                background: linear-gradient(45deg, #7c3aed, #a855f7);
-                border: 1px solid #a855f7;
-            }
-            .card { background-color: #2a2a2a; border: 1px solid rgba(168, 85, 247, 0.2); }
-            headerbar { background-color: #242424; border-bottom: 1px solid rgba(168, 85, 247, 0.3); }
-            .view, scrolledwindow > viewport { background-color: #242424; }
-        """
-
-    def get_sunset_css(self):
-        """Sunset (Orange) theme - dark background with orange accents"""
-        return b"""
-            @define-color accent_color #ff6b35;
-            @define-color accent_bg_color #ff6b35;
-            @define-color accent_fg_color #ffffff;
-            @define-color window_bg_color #1a1a1a;
-            @define-color view_bg_color #242424;
-            @define-color card_bg_color #2a2a2a;
-            @define-color headerbar_bg_color #242424;
-
-            window { background-color: #1a1a1a; }
-            .steam-code, .code-small, .code-medium, .code-large, .code-extra-large {
-                color: #ff6b35;
-            }
-            button.suggested-action {
-                background: linear-gradient(45deg, #e65100, #ff6b35);
-                border: 1px solid #ff6b35;
-            }
-            .card { background-color: #2a2a2a; border: 1px solid rgba(255, 107, 53, 0.2); }
-            headerbar { background-color: #242424; border-bottom: 1px solid rgba(255, 107, 53, 0.3); }
-            .view, scrolledwindow > viewport { background-color: #242424; }
-        """
-
-    def get_nord_css(self):
-        """Nord theme"""
-        return b"""
-            @define-color accent_color #88c0d0;
-            @define-color accent_bg_color #88c0d0;
-            @define-color accent_fg_color #2e3440;
-            @define-color window_bg_color #2e3440;
-            @define-color view_bg_color #3b4252;
-            @define-color card_bg_color #434c5e;
-            @define-color headerbar_bg_color #3b4252;
-
-            window { background-color: #2e3440; }
-            .steam-code, .code-small, .code-medium, .code-large, .code-extra-large {
-                color: #88c0d0;
-            }
-            button.suggested-action {
-                background: linear-gradient(45deg, #5e81ac, #88c0d0);
-                border: 1px solid #88c0d0;
-            }
-            .card { background-color: #434c5e; border: 1px solid rgba(136, 192, 208, 0.15); }
-            headerbar { background: linear-gradient(90deg, #2e3440, #3b4252); border-bottom: 1px solid rgba(136, 192, 208, 0.2); }
-            .view, scrolledwindow > viewport { background-color: #3b4252; }
-        """
-
-
-    def get_neon_css(self):
-        """Neon - hot pink/cyan cyberpunk theme"""
-        return b"""
-            @define-color accent_color #ff2d95;
-            @define-color accent_bg_color #ff2d95;
-            @define-color accent_fg_color #ffffff;
-            @define-color window_bg_color #0a0a12;
-            @define-color view_bg_color #12121f;
-            @define-color card_bg_color #1a1a2e;
-            @define-color headerbar_bg_color #12121f;
-
-            window { background-color: #0a0a12; }
-            .steam-code, .code-small, .code-medium, .code-large, .code-extra-large {
-                color: #ff2d95;
-            }
-            button.suggested-action {
-                background: linear-gradient(45deg, #ff2d95, #00d4ff);
-                border: 1px solid #ff2d95;
-            }
-            .card { background-color: #1a1a2e; border: 1px solid rgba(255, 45, 149, 0.2); }
-            headerbar { background-color: #12121f; border-bottom: 1px solid rgba(255, 45, 149, 0.3); }
-            .view, scrolledwindow > viewport { background-color: #12121f; }
-        """
-
-    def get_sakura_css(self):
-        """Sakura - cherry blossom pink light theme"""
-        return b"""
-            @define-color accent_color #ec4899;
-            @define-color accent_bg_color #ec4899;
-            @define-color accent_fg_color #ffffff;
-            @define-color window_bg_color #fdf2f8;
-            @define-color view_bg_color #fce7f3;
-            @define-color card_bg_color #fbcfe8;
-            @define-color headerbar_bg_color #fce7f3;
-
-            window { background-color: #fdf2f8; }
-            .steam-code, .code-small, .code-medium, .code-large, .code-extra-large {
-                color: #db2777;
-            }
-            button.suggested-action {
-                background: linear-gradient(45deg, #ec4899, #f472b6);
-                border: 1px solid #ec4899;
-            }
-            .card { background-color: #fbcfe8; border: 1px solid rgba(236, 72, 153, 0.2); }
-            headerbar { background-color: #fce7f3; border-bottom: 1px solid rgba(236, 72, 153, 0.2); }
-            .view, scrolledwindow > viewport { background-color: #fce7f3; }
-        """
-
-    def get_hacker_css(self):
-        """Hacker - matrix green on black terminal style"""
-        return b"""
-            @define-color accent_color #00ff41;
-            @define-color accent_bg_color #00ff41;
-            @define-color accent_fg_color #000000;
-            @define-color window_bg_color #0d0d0d;
-            @define-color view_bg_color #111111;
-            @define-color card_bg_color #1a1a1a;
-            @define-color headerbar_bg_color #111111;
-
-            window { background-color: #0d0d0d; }
-            .steam-code, .code-small, .code-medium, .code-large, .code-extra-large {
-                color: #00ff41;
-            }
-            button.suggested-action {
-                background: #00ff41;
-                color: #000000;
-                border: 1px solid #00ff41;
-            }
-            .card { background-color: #1a1a1a; border: 1px solid rgba(0, 255, 65, 0.15); }
-            headerbar { background-color: #111111; border-bottom: 1px solid rgba(0, 255, 65, 0.2); }
-            .view, scrolledwindow > viewport { background-color: #111111; }
-        """
-
-    def get_bubblegum_css(self):
-        """Bubblegum - bright pastel purple/blue fun theme"""
-        return b"""
-            @define-color accent_color #8b5cf6;
-            @define-color accent_bg_color #8b5cf6;
-            @define-color accent_fg_color #ffffff;
-            @define-color window_bg_color #faf5ff;
-            @define-color view_bg_color #f3e8ff;
-            @define-color card_bg_color #e9d5ff;
-            @define-color headerbar_bg_color #f3e8ff;
-
-            window { background-color: #faf5ff; }
-            .steam-code, .code-small, .code-medium, .code-large, .code-extra-large {
-                color: #7c3aed;
-            }
-            button.suggested-action {
-                background: linear-gradient(45deg, #8b5cf6, #06b6d4);
-                border: 1px solid #8b5cf6;
-            }
-            .card { background-color: #e9d5ff; border: 1px solid rgba(139, 92, 246, 0.2); }
-            headerbar { background-color: #f3e8ff; border-bottom: 1px solid rgba(139, 92, 246, 0.2); }
-            .view, scrolledwindow > viewport { background-color: #f3e8ff; }
-        """
-
-    def get_minimal_css(self):
-        """Minimal - clean grayscale, no distractions"""
-        return b"""
-            @define-color accent_color #525252;
-            @define-color accent_bg_color #525252;
-            @define-color accent_fg_color #ffffff;
-            @define-color window_bg_color #fafafa;
-            @define-color view_bg_color #f5f5f5;
-            @define-color card_bg_color #e5e5e5;
-            @define-color headerbar_bg_color #f5f5f5;
-
-            window { background-color: #fafafa; }
-            .steam-code, .code-small, .code-medium, .code-large, .code-extra-large {
-                color: #171717;
-            }
-            button.suggested-action {
-                background: #171717;
-                border: 1px solid #171717;
-            }
-            .card { background-color: #e5e5e5; border: 1px solid #d4d4d4; }
-            headerbar { background-color: #f5f5f5; border-bottom: 1px solid #d4d4d4; }
-            .view, scrolledwindow > viewport { background-color: #f5f5f5; }
-        """
-
 
 def main():
     app = SteamAuthenticatorApp()
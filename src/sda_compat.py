@@ -10,7 +10,7 @@ import base64
 import json
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Mapping, Tuple, Union
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -98,6 +98,21 @@ def read_sda_manifest(folder_path: Path) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _parse_sda_manifest(raw: Optional[bytes]) -> Optional[Dict[str, Any]]:
+    """Parse manifest.json bytes already held in memory (see read_sda_manifest)."""
+    if raw is None:
+        return None
+
+    try:
+        data = json.loads(raw)
+        if "entries" not in data:
+            return None
+        return data
+    except Exception as e:
+        logging.error(f"Failed to read SDA manifest: {e}")
+        return None
+
+
 def is_sda_folder(folder_path: Path) -> bool:
     """Check if a folder contains SDA-format maFiles (has manifest.json with entries)."""
     manifest = read_sda_manifest(folder_path)
@@ -232,19 +247,32 @@ def export_sda_accounts(
     return manifest, files
 
 
-def import_sda_accounts(folder_path: Path, passkey: Optional[str] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+def import_sda_accounts(
+    source: Union[Path, Mapping[str, bytes]], passkey: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], List[str]]:
     """
     Import all accounts from an SDA maFiles folder.
 
     Args:
-        folder_path: Path to the SDA maFiles directory
+        source: Path to the SDA maFiles directory, or a mapping of
+            {filename: bytes} (e.g. the members of a backup ZIP) so the
+            data never has to be written to disk
         passkey: Encryption passkey (required if manifest says encrypted)
 
     Returns:
         Tuple of (list of account dicts, list of error messages)
     """
-    folder_path = Path(folder_path)
-    manifest = read_sda_manifest(folder_path)
+    if isinstance(source, Mapping):
+        manifest = _parse_sda_manifest(source.get("manifest.json"))
+        read_file = source.get
+    else:
+        folder_path = Path(source)
+        manifest = read_sda_manifest(folder_path)
+
+        def read_file(filename):
+            file_path = folder_path / filename
+            return file_path.read_bytes() if file_path.exists() else None
+
     accounts = []
     errors = []
 
@@ -268,13 +296,13 @@ def import_sda_accounts(folder_path: Path, passkey: Optional[str] = None) -> Tup
         salt = entry.get("encryption_salt")
         iv = entry.get("encryption_iv")
 
-        file_path = folder_path / filename
-        if not file_path.exists():
-            errors.append(f"File not found: {filename}")
-            continue
-
         try:
-            file_content = file_path.read_text(encoding='utf-8').strip()
+            raw = read_file(filename)
+            if raw is None:
+                errors.append(f"File not found: {filename}")
+                continue
+
+            file_content = raw.decode('utf-8').strip()
 
             if is_encrypted:
                 if not salt or not iv:
@@ -6,7 +6,7 @@ import logging
 import os
 import tempfile
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from pathlib import Path
 import secrets
 from datetime import datetime
@@ -71,6 +71,12 @@ class SteamGuardAccount:
             self.game_bans = 0
             self.profile_visibility = 0
             self.last_api_refresh = ""
+
+        # (dumps function, snapshot of to_dict(), serialized bytes) from the
+        # last serialize()
+        self._serialized = None
+        # (shared_secret, decoded key bytes) for generate_steam_guard_code
+        self._decoded_secret = None
     
     def _extract_steamid(self, account_data: Dict[str, Any]) -> str:
         """Extract Steam ID from various possible locations in the account data"""
@@ -172,8 +178,10 @@ class SteamGuardAccount:
             # Steam uses 30-second intervals
             time_bytes = (timestamp // 30).to_bytes(8, byteorder='big')
 
-            # Decode the shared secret from base64
-            secret = base64.b64decode(self.shared_secret)
+            # Decode the shared secret from base64 (once per secret)
+            if self._decoded_secret is None or self._decoded_secret[0] != self.shared_secret:
+                self._decoded_secret = (self.shared_secret, base64.b64decode(self.shared_secret))
+            secret = self._decoded_secret[1]
 
             # Generate HMAC
             hmac_obj = hmac.new(secret, time_bytes, hashlib.sha1)
@@ -186,12 +194,14 @@ class SteamGuardAccount:
             code_int = int.from_bytes(hash_bytes[offset:offset + 4], byteorder='big') & 0x7FFFFFFF
 
             # Generate 5-character code using Steam's character set
-            code = ""
+            chars = self.STEAM_GUARD_CODE_CHARS
+            base = len(chars)
+            code = []
             for _ in range(5):
-                code += self.STEAM_GUARD_CODE_CHARS[code_int % len(self.STEAM_GUARD_CODE_CHARS)]
-                code_int //= len(self.STEAM_GUARD_CODE_CHARS)
+                code_int, index = divmod(code_int, base)
+                code.append(chars[index])
 
-            return code
+            return "".join(code)
         except (ValueError, base64.binascii.Error, KeyError) as e:
             logger.error(f"Error generating Steam Guard code: {e}")
             return ""
@@ -232,6 +242,18 @@ class SteamGuardAccount:
             data["token_gid"] = self.token_gid
         return data
 
+    def serialize(self, dumps: Callable[[Dict[str, Any]], bytes]) -> bytes:
+        """Return dumps(self.to_dict()), reusing the previous bytes if nothing changed"""
+        data = self.to_dict()
+        cached = self._serialized
+        if cached is not None and cached[0] is dumps and cached[1] == data:
+            return cached[2]
+
+        raw = dumps(data)
+        # session_data is mutated in place, so snapshot a copy of it
+        self._serialized = (dumps, dict(data, session=dict(self.session_data)), raw)
+        return raw
+
     def get_display_name_or_username(self) -> str:
         """Get display name if available, otherwise account name"""
         if self.display_name:
@@ -8,6 +8,23 @@ import io
 from typing import Dict, Any, Optional, Union
 
 
+def encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as a protobuf varint"""
+    # Unrolled for the common one- and two-byte cases (tags, lengths)
+    if value < 0x80:
+        return bytes((value,))
+    if value < 0x4000:
+        return bytes(((value & 0x7F) | 0x80, value >> 7))
+    if value < 0x200000:
+        return bytes(((value & 0x7F) | 0x80, ((value >> 7) & 0x7F) | 0x80, value >> 14))
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
 class ProtobufWriter:
     """Simple protobuf writer for Steam authentication messages"""
     
@@ -16,10 +33,7 @@ class ProtobufWriter:
     
     def write_varint(self, value: int):
         """Write a variable-length integer"""
-        while value >= 0x80:
-            self.buffer.write(bytes([value & 0x7F | 0x80]))
-            value >>= 7
-        self.buffer.write(bytes([value & 0x7F]))
+        self.buffer.write(encode_varint(value))
     
     def write_field(self, field_number: int, wire_type: int, value: Union[int, str, bytes]):
         """Write a protobuf field"""
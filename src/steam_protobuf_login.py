@@ -17,16 +17,19 @@ from steam_protobuf import SteamProtobufAuth
 class SteamProtobufLogin:
     """Steam login using protobuf messages like steamguard-cli"""
     
-    def __init__(self):
-        self.session = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        # An injected session is borrowed and left open on exit
+        self.session = session
+        self._owns_session = session is None
         self.protobuf = SteamProtobufAuth()
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self._owns_session:
+            self.session = aiohttp.ClientSession()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._owns_session and self.session:
             await self.session.close()
     
     async def send_protobuf_request(self, service: str, method: str, version: int, 
@@ -874,8 +874,11 @@ class AccountSelectorDialog(Adw.Window):
     def populate_accounts(self):
         """Populate the accounts list"""
         # Clear existing rows
-        while self.accounts_list.get_first_child():
-            self.accounts_list.remove(self.accounts_list.get_first_child())
+        row = self.accounts_list.get_first_child()
+        while row is not None:
+            next_row = row.get_next_sibling()
+            self.accounts_list.remove(row)
+            row = next_row
         
         if not self.filtered_accounts:
             self.accounts_list.set_visible(False)